@@ -0,0 +1,208 @@
+"""Benchmark the Froeling Connect integration against the mock server.
+
+For each facility count, sets up a config entry in a test Home Assistant
+instance and measures the setup time, the latency of refreshes that poll
+every component, the API calls made, the state writes per refresh and the
+peak memory allocated by Python. Run it from the repository root:
+
+    python -m benchmarks.bench --facilities 1 10 50 --cycles 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from aiohttp import ThreadedResolver
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.froeling_connect.const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_REQUESTS_PER_SECOND,
+)
+from homeassistant import loader
+from homeassistant.const import CONF_LANGUAGE, CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
+from homeassistant.helpers import frame
+from homeassistant.helpers.entity import Entity
+
+from .mock_server import USER_ID, MockFroelingServer, MockOptions, make_token
+
+DOMAIN = "froeling_connect"
+
+
+@dataclass
+class Result:
+    """Measurements of one scenario."""
+
+    facilities: int
+    entities: int
+    setup_s: float
+    setup_calls: int
+    refresh_p50_ms: float
+    refresh_max_ms: float
+    calls_per_refresh: float
+    writes_per_refresh: float
+    peak_memory_kib: float
+    connection_reuse: float | None
+
+
+async def run_scenario(
+    options: MockOptions, cycles: int, entry_options: dict[str, float]
+) -> Result:
+    """Set up the integration once and refresh it cycles times."""
+    server = MockFroelingServer(options)
+    await server.start()
+    writes = 0
+    original_write = Entity.async_write_ha_state
+
+    def count_write(entity: Entity) -> None:
+        nonlocal writes
+        writes += 1
+        original_write(entity)
+
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        server.patch_endpoints(),
+        patch.object(Entity, "async_write_ha_state", count_write),
+        # The mock server needs no name resolution, zeroconf would need
+        # the network integration
+        patch(
+            "homeassistant.helpers.aiohttp_client._async_make_resolver",
+            return_value=ThreadedResolver(),
+        ),
+    ):
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            frame.async_setup(hass)
+            # Let the loader find the integration in the working directory
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                title="benchmark",
+                unique_id=str(USER_ID),
+                data={
+                    CONF_USERNAME: "benchmark@example.com",
+                    CONF_PASSWORD: "benchmark",
+                    CONF_TOKEN: make_token(),
+                    CONF_LANGUAGE: "en",
+                    "send_changes": True,
+                    "user_id": USER_ID,
+                },
+                options=entry_options,
+            )
+            entry.add_to_hass(hass)
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            setup_s = time.perf_counter() - start
+            setup_calls = server.total_requests
+
+            coordinator = entry.runtime_data
+            keys = [
+                (facility_id, component_id)
+                for facility_id, components in coordinator.components.items()
+                for component_id in components
+            ]
+            latencies = []
+            calls = server.total_requests
+            writes = 0
+            for _ in range(cycles):
+                for key in keys:
+                    coordinator.scheduler.request_poll(key)
+                start = time.perf_counter()
+                await coordinator.async_refresh()
+                latencies.append(time.perf_counter() - start)
+            await hass.async_block_till_done()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            result = Result(
+                facilities=options.facilities,
+                entities=len(hass.states.async_entity_ids()),
+                setup_s=round(setup_s, 3),
+                setup_calls=setup_calls,
+                refresh_p50_ms=round(statistics.median(latencies) * 1000, 1),
+                refresh_max_ms=round(max(latencies) * 1000, 1),
+                calls_per_refresh=round((server.total_requests - calls) / cycles, 1),
+                writes_per_refresh=round(writes / cycles, 1),
+                peak_memory_kib=round(peak / 1024, 1),
+                connection_reuse=coordinator.account.connection_stats.reuse_ratio,
+            )
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+    await server.stop()
+    return result
+
+
+def _print_table(results: list[Result]) -> None:
+    columns = list(asdict(results[0]))
+    rows = [[str(value) for value in asdict(result).values()] for result in results]
+    widths = [
+        max(len(column), *(len(row[i]) for row in rows))
+        for i, column in enumerate(columns)
+    ]
+    for row in (columns, *rows):
+        cells = (cell.rjust(width) for cell, width in zip(row, widths, strict=True))
+        print("  ".join(cells))  # noqa: T201
+
+
+async def _main(args: argparse.Namespace) -> None:
+    results = [
+        await run_scenario(
+            MockOptions(
+                facilities=facilities,
+                latency=args.latency,
+                error_rate=args.error_rate,
+                change_rate=args.change_rate,
+                seed=facilities,
+            ),
+            args.cycles,
+            {
+                CONF_REQUESTS_PER_SECOND: args.requests_per_second,
+                CONF_MAX_CONCURRENT_REQUESTS: args.max_concurrent_requests,
+            },
+        )
+        for facilities in args.facilities
+    ]
+    if args.json:
+        json.dump([asdict(result) for result in results], sys.stdout, indent=2)
+        print()  # noqa: T201
+    else:
+        _print_table(results)
+
+
+def main() -> None:
+    """Run the benchmarks given on the command line."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--facilities", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--change-rate", type=float, default=0.1)
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=1000,
+        help="rate limit of the integration, high to measure its own overhead",
+    )
+    parser.add_argument("--max-concurrent-requests", type=int, default=4)
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""Local stand-in for the Froeling Connect cloud API.
+
+Serves the recorded payloads in ``payloads/`` for any number of facilities,
+with configurable latency, error and 401 rates. Use ``patch_endpoints`` to
+point the froeling library at the server, or run this module to serve it on
+a fixed port. Parameter changes are also sent to the websockets connected
+to ``/events``, the format the integration's push channel expects.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+import copy
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+from froeling import endpoints
+
+PAYLOADS = Path(__file__).parent / "payloads"
+COMPONENT_TEMPLATES = ("boiler", "heating_circuit", "hot_water", "buffer")
+USER_ID = 4242
+
+
+def make_token(user_id: int = USER_ID, lifetime: int = 3600) -> str:
+    """Return an unsigned JWT like the ones the cloud hands out."""
+
+    def encode(data: dict[str, Any]) -> str:
+        return base64.b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    payload = {"userId": user_id, "exp": int(time.time()) + lifetime}
+    return f"{encode({'alg': 'none'})}.{encode(payload)}.mock"
+
+
+def _fill(value: Any, replacements: dict[str, str]) -> Any:
+    """Replace the placeholders in all strings of a payload."""
+    if isinstance(value, str):
+        for placeholder, replacement in replacements.items():
+            value = value.replace(placeholder, replacement)
+        return value
+    if isinstance(value, list):
+        return [_fill(item, replacements) for item in value]
+    if isinstance(value, dict):
+        return {key: _fill(item, replacements) for key, item in value.items()}
+    return value
+
+
+def _iter_parameters(component: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    top_view = component.get("topView") or {}
+    for group in ("pictureParams", "infoParams", "configParams"):
+        yield from (top_view.get(group) or {}).values()
+    yield from component.get("stateView") or []
+    yield from component.get("setupView") or []
+
+
+@dataclass
+class MockOptions:
+    """Behaviour of the mock server."""
+
+    facilities: int = 1
+    # Extra delay of every response, in seconds
+    latency: float = 0.0
+    # Share of component requests answered with a 500
+    error_rate: float = 0.0
+    # Share of requests answered with a 401
+    unauthorized_rate: float = 0.0
+    # Share of read-only numeric values that change between two responses
+    change_rate: float = 0.1
+    # Seconds between changes pushed to /events without a request, 0 to
+    # only push written values
+    push_interval: float = 0.0
+    seed: int | None = None
+
+
+class MockFroelingServer:
+    """aiohttp application serving recorded Froeling Connect payloads."""
+
+    def __init__(self, options: MockOptions | None = None) -> None:
+        """Load the payloads and build the facilities."""
+        self.options = options or MockOptions()
+        self.requests: Counter[str] = Counter()
+        self.base_url = ""
+        self._random = random.Random(self.options.seed)
+        self._runner: web.AppRunner | None = None
+        self._websockets: set[web.WebSocketResponse] = set()
+        self._push_task: asyncio.Task[None] | None = None
+
+        facility_template = json.loads((PAYLOADS / "facility.json").read_text())
+        component_templates = {
+            name: json.loads((PAYLOADS / f"component_{name}.json").read_text())
+            for name in COMPONENT_TEMPLATES
+        }
+        self.facilities: dict[int, dict[str, Any]] = {}
+        self.components: dict[int, dict[str, dict[str, Any]]] = {}
+        for number in range(1, self.options.facilities + 1):
+            facility_id = 10000 + number
+            facility = copy.deepcopy(facility_template)
+            facility["facilityId"] = facility_id
+            facility["equipmentNumber"] = 100200300 + number
+            facility["name"] = f"{facility['name']} {number}"
+            self.facilities[facility_id] = facility
+            self.components[facility_id] = {}
+            for name, template in component_templates.items():
+                component_id = f"{facility_id}_{name}"
+                self.components[facility_id][component_id] = _fill(
+                    template,
+                    {"{component_id}": component_id, "{p}": component_id},
+                )
+
+        self.app = web.Application(middlewares=[self._middleware])
+        service = "/connect/v1.0/resources/service/user/{user_id}"
+        fcs = "/fcs/v1.0/resources/user/{user_id}/facility/{facility_id}"
+        self.app.router.add_post("/connect/v1.0/resources/login", self._login)
+        self.app.router.add_get(f"{service}/facility", self._facilities)
+        self.app.router.add_get(f"{service}/notification/count", self._count)
+        self.app.router.add_get(f"{service}/notification", self._notifications)
+        self.app.router.add_get(f"{fcs}/componentList", self._component_list)
+        self.app.router.add_get(f"{fcs}/component/{{component_id}}", self._component)
+        self.app.router.add_put(
+            f"{fcs}/parameter/{{parameter_id}}", self._set_parameter
+        )
+        self.app.router.add_get("/events", self._events)
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        resource = request.match_info.route.resource
+        self.requests[request.path if resource is None else resource.canonical] += 1
+        if self.options.latency:
+            await asyncio.sleep(self.options.latency)
+        if (
+            request.path not in ("/connect/v1.0/resources/login", "/events")
+            and self._random.random() < self.options.unauthorized_rate
+        ):
+            raise web.HTTPUnauthorized(text='{"message": "token expired"}')
+        return await handler(request)
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests served so far."""
+        return sum(self.requests.values())
+
+    @property
+    def events_url(self) -> str:
+        """Return the URL of the websocket sending parameter changes."""
+        return f"ws{self.base_url.removeprefix('http')}/events"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, return the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # noqa: SLF001
+        self.base_url = f"http://{host}:{sockets[0].getsockname()[1]}"
+        if self.options.push_interval:
+            self._push_task = asyncio.create_task(self._push_changes())
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._push_task is not None:
+            self._push_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._push_task
+        for ws in list(self._websockets):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def publish(
+        self, facility_id: int, component_id: str, parameters: list[dict[str, Any]]
+    ) -> None:
+        """Send changed parameters to the connected websockets."""
+        message = {
+            "facilityId": facility_id,
+            "componentId": component_id,
+            "parameters": [
+                {"id": parameter["id"], "value": parameter["value"]}
+                for parameter in parameters
+            ],
+        }
+        for ws in list(self._websockets):
+            with suppress(ConnectionError):
+                await ws.send_json(message)
+
+    async def _push_changes(self) -> None:
+        keys = [
+            (facility_id, component_id)
+            for facility_id, components in self.components.items()
+            for component_id in components
+        ]
+        while True:
+            await asyncio.sleep(self.options.push_interval)
+            facility_id, component_id = self._random.choice(keys)
+            if changed := self._change_values(
+                self.components[facility_id][component_id]
+            ):
+                await self.publish(facility_id, component_id, changed)
+
+    def _change_values(self, component: dict[str, Any]) -> list[dict[str, Any]]:
+        """Move some read-only numeric values by one, return the changed ones."""
+        changed = []
+        for parameter in _iter_parameters(component):
+            if (
+                not parameter["editable"]
+                and parameter["parameterType"] == "NumValueObject"
+                and parameter["maxVal"] != "1"
+                and self._random.random() < self.options.change_rate
+            ):
+                value = int(parameter["value"]) + self._random.choice((-1, 1))
+                value = min(
+                    max(value, int(parameter["minVal"])), int(parameter["maxVal"])
+                )
+                parameter["value"] = str(value)
+                changed.append(parameter)
+        return changed
+
+    @contextmanager
+    def patch_endpoints(self) -> Iterator[None]:
+        """Point the froeling library at this server."""
+        original = {
+            name: value
+            for name, value in vars(endpoints).items()
+            if name.isupper() and isinstance(value, str)
+        }
+        for name, value in original.items():
+            setattr(
+                endpoints,
+                name,
+                value.replace("https://connect-api.froeling.com", self.base_url),
+            )
+        try:
+            yield
+        finally:
+            for name, value in original.items():
+                setattr(endpoints, name, value)
+
+    async def _login(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"userData": {"userId": USER_ID}},
+            headers={"Authorization": make_token()},
+        )
+
+    async def _facilities(self, request: web.Request) -> web.Response:
+        return web.json_response(list(self.facilities.values()))
+
+    async def _count(self, request: web.Request) -> web.Response:
+        return web.json_response({"unreadNotifications": 0})
+
+    async def _notifications(self, request: web.Request) -> web.Response:
+        return web.json_response([])
+
+    async def _component_list(self, request: web.Request) -> web.Response:
+        facility_id = int(request.match_info["facility_id"])
+        if facility_id not in self.components:
+            raise web.HTTPNotFound
+        return web.json_response(
+            [
+                {
+                    key: component[key]
+                    for key in (
+                        "componentId",
+                        "displayName",
+                        "displayCategory",
+                        "standardName",
+                        "type",
+                        "subType",
+                    )
+                }
+                for component in self.components[facility_id].values()
+            ]
+        )
+
+    async def _component(self, request: web.Request) -> web.Response:
+        facility_id = int(request.match_info["facility_id"])
+        component_id = request.match_info["component_id"]
+        try:
+            component = self.components[facility_id][component_id]
+        except KeyError:
+            raise web.HTTPNotFound from None
+        if self._random.random() < self.options.error_rate:
+            raise web.HTTPInternalServerError(text='{"message": "mock error"}')
+        self._change_values(component)
+        return web.json_response(component)
+
+    async def _set_parameter(self, request: web.Request) -> web.Response:
+        facility_id = int(request.match_info["facility_id"])
+        parameter_id = request.match_info["parameter_id"]
+        value = str((await request.json())["value"])
+        for component_id, component in self.components.get(facility_id, {}).items():
+            for parameter in _iter_parameters(component):
+                if parameter["id"] != parameter_id:
+                    continue
+                if not parameter["editable"]:
+                    raise web.HTTPForbidden
+                if parameter["value"] == value:
+                    raise web.HTTPNotModified
+                parameter["value"] = value
+                await self.publish(facility_id, component_id, [parameter])
+                return web.json_response({"id": parameter_id, "value": value})
+        raise web.HTTPNotFound
+
+    async def _events(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._websockets.add(ws)
+        try:
+            async for _ in ws:
+                pass
+        finally:
+            self._websockets.discard(ws)
+        return ws
+
+
+async def _serve(options: MockOptions, port: int) -> None:
+    server = MockFroelingServer(options)
+    url = await server.start(port=port)
+    print(f"Serving {options.facilities} facilities at {url}")  # noqa: T201
+    print(f"Push channel: {server.events_url}")  # noqa: T201
+    print(f"Token: {make_token()}")  # noqa: T201
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Serve the mock API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--facilities", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0)
+    parser.add_argument("--change-rate", type=float, default=0.1)
+    parser.add_argument("--push-interval", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    options = MockOptions(
+        facilities=args.facilities,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        unauthorized_rate=args.unauthorized_rate,
+        change_rate=args.change_rate,
+        push_interval=args.push_interval,
+        seed=args.seed,
+    )
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_serve(options, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import PLATFORMS
+from .cache import DiscoveryCache
+from .const import DOMAIN, PLATFORMS
 from .coordinator import (
     FroelingConnectConfigEntry,
     FroelingConnectDataUpdateCoordinator,
 )
+from .errors import ErrorMonitor
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services of Fröling Connect."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(
@@ -23,6 +36,8 @@ async def async_setup_entry(
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
@@ -32,3 +47,19 @@ async def async_unload_entry(
     """Unload a config entry."""
 
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_reload_entry(
+    hass: HomeAssistant, entry: FroelingConnectConfigEntry
+) -> None:
+    """Reload the config entry when its options change."""
+    if entry.options != entry.runtime_data.applied_options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: FroelingConnectConfigEntry
+) -> None:
+    """Remove the discovery cache and the error issues of a removed config entry."""
+    await DiscoveryCache(hass, entry.entry_id).async_remove()
+    ErrorMonitor(hass, entry.entry_id).async_remove_issues()
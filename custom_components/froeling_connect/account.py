@@ -0,0 +1,370 @@
+"""Froeling Connect clients shared by the config entries of an account."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import json
+from typing import Any
+
+from froeling import Facility, Froeling
+from froeling.datamodels import NotificationOverview
+from froeling.exceptions import AuthenticationError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .circuit_breaker import OUTAGE_ERRORS, CircuitBreaker
+from .connection import ConnectionProfile, ConnectionStats, create_clientsession
+from .const import (
+    BREAKER_BASE_DELAY,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_JITTER,
+    BREAKER_MAX_DELAY,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DOMAIN,
+    LOGGER,
+    NOTIFICATION_MAX_AGE,
+    REQUEST_BURST,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_RETRY_DELAY,
+)
+from .ratelimit import RequestRateLimiter
+
+
+def account_key(username: str) -> str:
+    """Return the key of an account in the registry."""
+    return username.strip().casefold()
+
+
+def token_expiry(token: str | None) -> datetime | None:
+    """Return when a token expires, None if it does not say."""
+    if not token:
+        return None
+    try:
+        payload = token.split(".")[1].replace("-", "+").replace("_", "/")
+        expires = json.loads(base64.b64decode(payload + "=" * (-len(payload) % 4)))[
+            "exp"
+        ]
+        return dt_util.utc_from_timestamp(float(expires))
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+async def async_fetch_facilities(client: Froeling) -> list[Facility]:
+    """Fetch the facilities of a client from the cloud.
+
+    The client keeps the first list it fetched, and clients live as long as
+    their account. Its cache is cleared, so that added or removed
+    facilities are seen.
+    """
+    client._facilities.clear()  # noqa: SLF001
+    return await client.get_facilities()
+
+
+class FroelingAccount:
+    """One login to the Froeling Connect cloud.
+
+    All config entries of the account share the HTTP session, the token and
+    the request budget. The session has its own pool of connections, see
+    connection.create_clientsession. The cloud answers in the language of the request,
+    so there is one client per language, all using the same token. The
+    account logs in again shortly before the token expires, and pauses all
+    requests while the cloud is failing.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: ConnectionProfile,
+        username: str,
+        password: str,
+        token: str | None,
+        requests_per_second: float,
+        max_concurrent_requests: int,
+    ) -> None:
+        """Initialize the account."""
+        self.hass = hass
+        self.connection = connection
+        self.connection_stats = ConnectionStats()
+        self.clientsession = create_clientsession(connection, self.connection_stats)
+        self.username = username
+        self.password = password
+        self.token: str | None = None
+        self.token_expires: datetime | None = None
+        self.rate_limiter = RequestRateLimiter(
+            rate=requests_per_second,
+            burst=REQUEST_BURST,
+            max_in_flight=max_concurrent_requests,
+            on_request=self._handle_request,
+        )
+        self.breaker = CircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD,
+            BREAKER_BASE_DELAY,
+            BREAKER_MAX_DELAY,
+            BREAKER_JITTER,
+        )
+        # Config entries using the account
+        self.entry_ids: set[str] = set()
+        self._clients: dict[str, Froeling] = {}
+        self._login_lock = asyncio.Lock()
+        self._request_listeners: list[Callable[[], None]] = []
+        self._token_listeners: list[Callable[[str], None]] = []
+        self._cancel_refresh: CALLBACK_TYPE | None = None
+        # Notifications per language and when they were fetched
+        self._notifications: dict[str, tuple[datetime, list[NotificationOverview]]] = {}
+        self._notification_fetches: dict[
+            str, asyncio.Task[list[NotificationOverview]]
+        ] = {}
+        # The session outlives the config entry that created it
+        self._unsub_close = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._handle_close
+        )
+        self.set_token(token)
+
+    def client(self, language: str) -> Froeling:
+        """Return the client of the account for a language."""
+        if (client := self._clients.get(language)) is None:
+            client = self._clients[language] = Froeling(
+                username=self.username,
+                password=self.password,
+                token=self.token,
+                auto_reauth=False,
+                language=language,
+                logger=LOGGER,
+                clientsession=self.clientsession,
+            )
+        return client
+
+    async def async_login(self) -> Froeling:
+        """Log in and hand the new token to the clients of all languages.
+
+        Returns the client that logged in.
+        """
+        async with self._login_lock:
+            return await self._async_login()
+
+    async def async_relogin(self, rejected_token: str | None) -> None:
+        """Log in again after the cloud rejected a token.
+
+        Does nothing if the token was replaced in the meantime, so that
+        requests failing together only log in once.
+        """
+        async with self._login_lock:
+            if self.token != rejected_token:
+                return
+            LOGGER.debug("Token of %s was rejected, logging in", self.username)
+            await self._async_login()
+
+    async def _async_login(self) -> Froeling:
+        client = next(iter(self._clients.values()), None) or self.client("en")
+        async with self.rate_limiter, asyncio.timeout(DEFAULT_REQUEST_TIMEOUT):
+            await client.login()
+        self.set_token(client.token)
+        for token_listener in list(self._token_listeners):
+            token_listener(client.token)
+        return client
+
+    @callback
+    def set_password(self, password: str) -> None:
+        """Log in with a new password from now on."""
+        self.password = password
+        for client in self._clients.values():
+            client.session.password = password
+
+    @callback
+    def set_token(self, token: str | None) -> None:
+        """Use a token for all requests of the account."""
+        self.token = token
+        self.token_expires = token_expiry(token)
+        for client in self._clients.values():
+            if token is not None and client.token != token:
+                client.session.set_token(token)
+        self._schedule_refresh(
+            None
+            if self.token_expires is None
+            else self.token_expires - TOKEN_REFRESH_MARGIN
+        )
+
+    @callback
+    def _schedule_refresh(self, when: datetime | None) -> None:
+        if self._cancel_refresh is not None:
+            self._cancel_refresh()
+            self._cancel_refresh = None
+        if when is not None:
+            self._cancel_refresh = async_track_point_in_utc_time(
+                self.hass, self._handle_refresh_due, when
+            )
+
+    @callback
+    def _handle_refresh_due(self, _now: datetime) -> None:
+        self._cancel_refresh = None
+        self.hass.async_create_background_task(
+            self._async_refresh_token(), f"{DOMAIN} refresh token"
+        )
+
+    async def _async_refresh_token(self) -> None:
+        """Replace the token before it expires."""
+        LOGGER.debug("Token of %s expires soon, logging in", self.username)
+        try:
+            await self.async_login()
+        except OUTAGE_ERRORS as e:
+            LOGGER.warning("Could not renew the token, retrying: %r", e)
+            self._schedule_refresh(dt_util.utcnow() + TOKEN_RETRY_DELAY)
+        except AuthenticationError as e:
+            # The next rejected request starts the reauth flow
+            LOGGER.warning("Could not renew the token: %r", e)
+
+    async def async_get_notifications(
+        self,
+        language: str,
+        request: Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]],
+    ) -> list[NotificationOverview]:
+        """Return the notifications of the account.
+
+        The config entries of the account check them on their own schedules,
+        but they are fetched once per NOTIFICATION_MAX_AGE. Entries asking
+        while they are fetched wait for the same request. Requests are made
+        through ``request``, which runs them within the request budget.
+        """
+        cached = self._notifications.get(language)
+        if cached is not None and dt_util.utcnow() - cached[0] < NOTIFICATION_MAX_AGE:
+            return cached[1]
+        if (fetch := self._notification_fetches.get(language)) is None:
+            fetch = self._notification_fetches[language] = (
+                self.hass.async_create_background_task(
+                    self._async_fetch_notifications(language, request),
+                    f"{DOMAIN} notifications",
+                )
+            )
+            fetch.add_done_callback(
+                lambda _: self._notification_fetches.pop(language, None)
+            )
+        # Cancelling one entry must not cancel the fetch of the others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch_notifications(
+        self,
+        language: str,
+        request: Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]],
+    ) -> list[NotificationOverview]:
+        """Fetch the notifications, the list only if some are unread."""
+        client = self.client(language)
+        notifications: list[NotificationOverview] = []
+        if await request(client.get_notification_count):
+            notifications = await request(client.get_notifications)
+        self._notifications[language] = (dt_util.utcnow(), notifications)
+        return notifications
+
+    @callback
+    def async_add_token_listener(
+        self, token_listener: Callable[[str], None]
+    ) -> CALLBACK_TYPE:
+        """Call token_listener with every token the account logs in with."""
+        self._token_listeners.append(token_listener)
+
+        @callback
+        def remove_listener() -> None:
+            if token_listener in self._token_listeners:
+                self._token_listeners.remove(token_listener)
+
+        return remove_listener
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop renewing the token and close the HTTP session."""
+        self._schedule_refresh(None)
+        for fetch in self._notification_fetches.values():
+            fetch.cancel()
+        self._unsub_close()
+        self._close_clientsession()
+
+    @callback
+    def _handle_close(self, _event: Event) -> None:
+        self._close_clientsession()
+
+    @callback
+    def _close_clientsession(self) -> None:
+        self.hass.async_create_background_task(
+            self.clientsession.close(), f"{DOMAIN} close session"
+        )
+
+    @callback
+    def async_add_request_listener(
+        self, request_listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call request_listener for every request of the account."""
+        self._request_listeners.append(request_listener)
+
+        @callback
+        def remove_listener() -> None:
+            if request_listener in self._request_listeners:
+                self._request_listeners.remove(request_listener)
+
+        return remove_listener
+
+    @callback
+    def _handle_request(self) -> None:
+        for request_listener in self._request_listeners:
+            request_listener()
+
+
+@callback
+def async_get_account(hass: HomeAssistant, username: str) -> FroelingAccount | None:
+    """Return the account of a username if a config entry uses it."""
+    accounts: dict[str, FroelingAccount] = hass.data.get(DOMAIN, {})
+    return accounts.get(account_key(username))
+
+
+@callback
+def async_acquire_account(hass: HomeAssistant, entry: ConfigEntry) -> FroelingAccount:
+    """Return the account of a config entry, create it for the first entry.
+
+    The request budget and the connection profile are taken from the
+    options of the first entry.
+    """
+    accounts: dict[str, FroelingAccount] = hass.data.setdefault(DOMAIN, {})
+    key = account_key(entry.data[CONF_USERNAME])
+    if (account := accounts.get(key)) is None:
+        account = accounts[key] = FroelingAccount(
+            hass,
+            ConnectionProfile.from_options(entry.options),
+            entry.data[CONF_USERNAME],
+            entry.data[CONF_PASSWORD],
+            entry.data[CONF_TOKEN],
+            entry.options.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND),
+            entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            ),
+        )
+    else:
+        LOGGER.debug("Sharing the connection of %s", account.username)
+    account.entry_ids.add(entry.entry_id)
+    return account
+
+
+@callback
+def async_release_account(
+    hass: HomeAssistant, account: FroelingAccount, entry_id: str
+) -> None:
+    """Stop using the account for a config entry, close it after the last one."""
+    account.entry_ids.discard(entry_id)
+    accounts: dict[str, FroelingAccount] = hass.data.get(DOMAIN, {})
+    key = account_key(account.username)
+    if not account.entry_ids and accounts.get(key) is account:
+        del accounts[key]
+        account.async_shutdown()
@@ -0,0 +1,88 @@
+"""Detect whether a facility is firing from its live parameter values."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from froeling import Parameter
+
+from .classification import is_binary
+
+# Read-only 0/1 parameters whose name contains one of these are on while firing.
+_ACTIVE_FLAG_NAMES = ("flame", "burner", "ignition")
+# Read-only string parameters whose name contains one of these hold the boiler state.
+_BOILER_STATE_NAMES = ("boilerstate", "boiler_state")
+# Boiler states (lower case) in which the boiler is not firing.
+_IDLE_STATES = frozenset(
+    {
+        "off",
+        "aus",
+        "idle",
+        "standby",
+        "ready",
+        "bereit",
+        "betriebsbereit",
+        "boiler off",
+        "kessel aus",
+    }
+)
+
+
+def is_active(parameters: Iterable[Parameter]) -> bool | None:
+    """Return if the parameters show a firing boiler.
+
+    Returns None if none of the parameters tell whether the boiler is firing.
+    """
+    has_indicator = False
+    for parameter in parameters:
+        if parameter.editable:
+            continue
+        name = (parameter.name or "").lower()
+        if (
+            parameter.parameter_type == "NumValueObject"
+            and is_binary(parameter)
+            and any(flag in name for flag in _ACTIVE_FLAG_NAMES)
+        ):
+            if parameter.value == "1":
+                return True
+            has_indicator = True
+        elif parameter.parameter_type == "StringValueObject" and any(
+            state in name for state in _BOILER_STATE_NAMES
+        ):
+            label = (parameter.string_list_key_values or {}).get(
+                str(parameter.value), str(parameter.value)
+            )
+            if label.lower() not in _IDLE_STATES:
+                return True
+            has_indicator = True
+    return False if has_indicator else None
+
+
+class ActivityTracker:
+    """Debounced activity state of a facility.
+
+    A facility counts as active as soon as it is seen firing, and as idle
+    once it has not been seen firing for ``idle_after`` updates in a row.
+    """
+
+    def __init__(self, idle_after: int) -> None:
+        """Initialize the tracker in the unknown state."""
+        self.active: bool | None = None
+        self._idle_after = idle_after
+        self._idle_count = 0
+
+    def update(self, observed: bool | None) -> bool:
+        """Feed an observation, return if the activity state changed."""
+        if observed is None or observed:
+            self._idle_count = 0
+            changed = self.active is not observed
+            self.active = observed
+            return changed
+
+        self._idle_count += 1
+        if self.active is False or (
+            self.active is True and self._idle_count < self._idle_after
+        ):
+            return False
+        self.active = False
+        return True
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import generate_entity_id
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    ENTITY_ID_FORMAT,
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.const import EntityCategory, Platform
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, CONF_SEND_CHANGES
+from .circuit_breaker import BreakerState
+from .const import ATTRIBUTION
 from .coordinator import (
     FroelingConnectConfigEntry,
     FroelingConnectDataUpdateCoordinator,
 )
+from .entity import FroelingConnectEntity, async_add_parameter_entities
 
 binary_sensor_deviceclass_mapping = {}
 
@@ -25,60 +33,66 @@ async def async_setup_entry(
     """Add Froeling Connect entities from a config_entry."""
     coordinator = entry.runtime_data
 
-    entities = []
-    for idx, param in coordinator.data.parameters.items():
-        if param.editable and entry.data[CONF_SEND_CHANGES]:
-            continue  # Use switch instead
-        if param.parameter_type != "NumValueObject":
-            continue
-        if param.min_val == "0" and param.max_val == "1" and param.unit == "":
-            entities.append(FroelingConnectBinarySensor(coordinator, idx))
+    async_add_parameter_entities(
+        coordinator,
+        Platform.BINARY_SENSOR,
+        async_add_entities,
+        lambda idx: FroelingConnectBinarySensor(coordinator, idx),
+    )
+    async_add_entities([FroelingConnectCloudOutageBinarySensor(coordinator)])
 
-    async_add_entities(entities)
 
-
-class FroelingConnectBinarySensor(
-    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], BinarySensorEntity
-):
+class FroelingConnectBinarySensor(FroelingConnectEntity, BinarySensorEntity):
     """Representation of a BinarySensor."""
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: FroelingConnectDataUpdateCoordinator,
         idx: tuple[int, str, str],
     ) -> None:
         """Initialize binary_sensor platform for Froeling Connect integration."""
-        super().__init__(coordinator, context=idx)
-
-        self._idx = idx  # (facility_id, component_id, parameter_id)
+        super().__init__(coordinator, idx, ENTITY_ID_FORMAT)
 
-        parameter = coordinator.data.parameters[idx]
-        component = coordinator.components[idx[0]][idx[1]]
-        self.parameter = parameter
-        self.component = component
+        self._update_from_parameter()
 
-        self._attr_name = parameter.display_name
-        self._attr_unique_id = f"{idx[0]}_{idx[1]}_{idx[2]}"
-        self.entity_id = generate_entity_id(
-            "binary_sensor.{}",
-            f"{idx[0]}_{component.display_name}_{parameter.name}",
-            hass=coordinator.hass,
-        )
+    def _update_from_parameter(self) -> None:
+        self._attr_is_on = self.value == "1"
 
-        self._attr_device_info = self.coordinator.component_device_info[
-            (self._idx[0], self._idx[1])
-        ]
 
-        self._attr_is_on = parameter.value == "1"
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        parameter = self.coordinator.data.parameters[self._idx]
-        self._attr_is_on = parameter.value == "1"
-        self.parameter = parameter
+class FroelingConnectCloudOutageBinarySensor(
+    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], BinarySensorEntity
+):
+    """Diagnostic sensor that is on while requests to the cloud are paused."""
 
-        self.async_write_ha_state()
+    _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_translation_key = "cloud_outage"
+
+    def __init__(self, coordinator: FroelingConnectDataUpdateCoordinator) -> None:
+        """Initialize the circuit breaker sensor."""
+        super().__init__(coordinator)
+
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_cloud_outage"
+        self._attr_device_info = coordinator.account_device_info
+
+    @property
+    def available(self) -> bool:
+        """Return True, the breaker is known when a refresh failed."""
+        return True
+
+    @property
+    def is_on(self) -> bool:
+        """Return True unless the circuit breaker is closed."""
+        return self.coordinator.account.breaker.state is not BreakerState.CLOSED
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state of the circuit breaker."""
+        breaker = self.coordinator.account.breaker
+        return {
+            "breaker_state": breaker.state,
+            "failures": breaker.failures,
+            "retry_at": breaker.retry_at,
+        }
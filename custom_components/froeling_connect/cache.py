@@ -0,0 +1,120 @@
+"""Persistent cache of the facilities and components of a config entry."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from froeling import Component, Facility, Parameter, Session
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+_COMPONENT_FIELDS = (
+    "display_name",
+    "display_category",
+    "standard_name",
+    "type",
+    "sub_type",
+)
+_PARAMETER_FIELDS = (
+    "id",
+    "display_name",
+    "name",
+    "editable",
+    "parameter_type",
+    "unit",
+    "value",
+    "min_val",
+    "max_val",
+    "string_list_key_values",
+)
+
+
+def facility_to_dict(facility: Facility) -> dict[str, Any]:
+    """Return the data of a facility that is needed to register its device."""
+    return {
+        "facility_id": facility.facility_id,
+        "name": facility.name,
+        "facility_generation": facility.facility_generation,
+        "equipment_number": facility.equipment_number,
+    }
+
+
+def component_to_dict(component: Component) -> dict[str, Any]:
+    """Serialize a component together with its parameters."""
+    return {
+        "facility_id": component.facility_id,
+        "component_id": component.component_id,
+        **{name: getattr(component, name, None) for name in _COMPONENT_FIELDS},
+        "parameters": [
+            {name: getattr(parameter, name) for name in _PARAMETER_FIELDS}
+            for parameter in component.parameters.values()
+        ],
+        # Raw, see schedule.WeeklySchedule
+        "time_windows": [day.raw for day in component.time_windows_view or ()],
+    }
+
+
+def component_from_dict(data: dict[str, Any], session: Session) -> Component:
+    """Restore a component serialized by component_to_dict."""
+    facility_id = data["facility_id"]
+    component = Component(facility_id, data["component_id"], session)
+    for name in _COMPONENT_FIELDS:
+        setattr(component, name, data.get(name))
+    component.parameters = {
+        parameter["id"]: Parameter(
+            session,
+            facility_id,
+            **{name: parameter.get(name) for name in _PARAMETER_FIELDS},
+        )
+        for parameter in data["parameters"]
+    }
+    return component
+
+
+class DiscoveryCache:
+    """Stores the facilities and components discovered for a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+
+    async def async_load(self, language: str) -> dict[str, Any] | None:
+        """Load the cached facilities and components.
+
+        Returns None if nothing was cached in the given language, as the
+        names and value labels of the parameters depend on it.
+        """
+        if (data := await self._store.async_load()) is None:
+            return None
+        if data.get("language") != language:
+            return None
+        return data
+
+    @callback
+    def async_schedule_save(
+        self,
+        language: str,
+        facilities: list[dict[str, Any]],
+        components: list[Component],
+    ) -> None:
+        """Save the facilities and components after a short delay."""
+        self._store.async_delay_save(
+            lambda: {
+                "language": language,
+                "facilities": facilities,
+                "components": [component_to_dict(c) for c in components],
+            },
+            SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the cache."""
+        await self._store.async_remove()
@@ -0,0 +1,120 @@
+"""Platform for Fröling Connect integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import ATTRIBUTION
+from .coordinator import (
+    FroelingConnectConfigEntry,
+    FroelingConnectDataUpdateCoordinator,
+)
+
+# How far ahead the next time window is looked for
+_LOOKAHEAD = timedelta(days=8)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: FroelingConnectConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add a calendar for every component with time windows."""
+    coordinator = entry.runtime_data
+    added: set[tuple[int, str]] = set()
+
+    @callback
+    def async_add_schedules() -> None:
+        if new := coordinator.schedules.keys() - added:
+            added.update(new)
+            async_add_entities(
+                FroelingConnectScheduleCalendar(coordinator, key) for key in new
+            )
+
+    async_add_schedules()
+    # Schedules restored without time windows show up with the first poll
+    entry.async_on_unload(coordinator.async_add_listener(async_add_schedules))
+
+
+class FroelingConnectScheduleCalendar(
+    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], CalendarEntity
+):
+    """The weekly time windows of a component as a calendar.
+
+    The calendar is on during a time window. The events repeat every week
+    and are computed from the schedule, which the coordinator only rebuilds
+    when the time windows change.
+    """
+
+    _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+    _attr_translation_key = "schedule"
+
+    def __init__(
+        self,
+        coordinator: FroelingConnectDataUpdateCoordinator,
+        key: tuple[int, str],
+    ) -> None:
+        """Initialize the calendar of a component."""
+        super().__init__(coordinator, context=key)
+
+        self._key = key
+        self._summary = coordinator.components[key[0]][key[1]].display_name or key[1]
+        self._attr_unique_id = f"{key[0]}_{key[1]}_schedule"
+        self._attr_device_info = coordinator.component_device_info[key]
+        self._written_available: bool | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return if the component still has time windows."""
+        return super().available and self._key in self.coordinator.schedules
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or the next time window."""
+        now = dt_util.now()
+        return next(self._events(now, now + _LOOKAHEAD), None)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the time windows between start_date and end_date."""
+        return list(self._events(start_date, end_date))
+
+    def _events(self, start: datetime, end: datetime) -> Iterator[CalendarEvent]:
+        if (schedule := self.coordinator.schedules.get(self._key)) is None:
+            return
+        for window_start, window_end in schedule.events(
+            start, end, dt_util.get_default_time_zone()
+        ):
+            yield CalendarEvent(
+                start=window_start, end=window_end, summary=self._summary
+            )
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the availability written when the entity was added."""
+        await super().async_added_to_hass()
+        self._written_available = self.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the schedule or the availability changed.
+
+        Between changes, the calendar updates itself at the start and the
+        end of each time window.
+        """
+        available = self.available
+        if (
+            self._key not in self.coordinator.data.changed_schedules
+            and available is self._written_available
+        ):
+            return
+        self._written_available = available
+        self.async_write_ha_state()
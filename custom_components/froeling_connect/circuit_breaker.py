@@ -0,0 +1,143 @@
+"""Circuit breaker for outages of the Froeling Connect cloud."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from enum import StrEnum
+import random
+
+from aiohttp import ClientError
+from froeling.exceptions import NetworkError
+
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER
+
+
+class BreakerState(StrEnum):
+    """State of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CloudUnavailableError(Exception):
+    """Raised instead of making a request while the circuit breaker is open."""
+
+    def __init__(self, retry_at: datetime) -> None:
+        """Initialize the error."""
+        super().__init__(f"Froeling Connect is unavailable until {retry_at}")
+        self.retry_at = retry_at
+
+
+# Errors of a request the cloud did not answer with the data. ClientError is
+# raised by aiohttp when no connection could be made or it was dropped.
+OUTAGE_ERRORS = (NetworkError, TimeoutError, ClientError, CloudUnavailableError)
+
+
+def is_outage(error: BaseException) -> bool:
+    """Return if an error means that the cloud could not answer."""
+    if isinstance(error, NetworkError):
+        return error.status is None or error.status >= 500
+    return isinstance(error, (TimeoutError, ClientError))
+
+
+class CircuitBreaker:
+    """Stop sending requests while the cloud is failing.
+
+    After ``failure_threshold`` failed requests in a row the breaker opens
+    and requests fail right away. It stays open for ``base_delay``, doubled
+    for every further failed attempt up to ``max_delay``, each delay varied
+    by ``jitter`` so that several installations do not retry in lockstep.
+    Then a single probe request is let through (half-open). If it succeeds
+    the breaker closes, otherwise it opens again for longer. Requests made
+    while the probe is running wait for its outcome.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        base_delay: timedelta,
+        max_delay: timedelta,
+        jitter: float,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.state = BreakerState.CLOSED
+        # Failed requests since the last success
+        self.failures = 0
+        # Times the breaker opened since it was last closed
+        self.openings = 0
+        self.retry_at: datetime | None = None
+        self._probe_done: asyncio.Event | None = None
+
+    def time_until_retry(self, now: datetime) -> timedelta | None:
+        """Return how long the breaker stays open, None if requests may start."""
+        if self.state is not BreakerState.OPEN or self.retry_at is None:
+            return None
+        if (remaining := self.retry_at - now) <= timedelta(0):
+            return None
+        return remaining
+
+    async def async_before_request(self) -> None:
+        """Wait until a request may be made.
+
+        Raises CloudUnavailableError while the breaker is open. The first
+        request after the delay becomes the probe.
+        """
+        while True:
+            if self.state is BreakerState.CLOSED:
+                return
+            if self.state is BreakerState.OPEN:
+                assert self.retry_at is not None
+                if dt_util.utcnow() < self.retry_at:
+                    raise CloudUnavailableError(self.retry_at)
+                LOGGER.debug("Probing whether Froeling Connect is back")
+                self.state = BreakerState.HALF_OPEN
+                self._probe_done = asyncio.Event()
+                return
+            assert self._probe_done is not None
+            await self._probe_done.wait()
+
+    def record_success(self) -> None:
+        """Close the breaker, the cloud answered."""
+        if self.state is not BreakerState.CLOSED:
+            LOGGER.info("Froeling Connect is reachable again")
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.openings = 0
+        self.retry_at = None
+        self._end_probe()
+
+    def record_failure(self) -> None:
+        """Count a request the cloud could not answer, open if it keeps failing."""
+        self.failures += 1
+        if self.state is BreakerState.OPEN or (
+            self.state is BreakerState.CLOSED and self.failures < self.failure_threshold
+        ):
+            return
+        delay = min(self.base_delay * 2**self.openings, self.max_delay)
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.openings += 1
+        self.state = BreakerState.OPEN
+        self.retry_at = dt_util.utcnow() + delay
+        LOGGER.warning(
+            "Froeling Connect is failing, pausing requests until %s", self.retry_at
+        )
+        self._end_probe()
+
+    def record_aborted(self) -> None:
+        """Let the next request probe again if the probe was cancelled."""
+        if self.state is BreakerState.HALF_OPEN:
+            self.state = BreakerState.OPEN
+            self._end_probe()
+
+    def _end_probe(self) -> None:
+        if self._probe_done is not None:
+            self._probe_done.set()
+            self._probe_done = None
@@ -0,0 +1,153 @@
+"""Decide which platform represents each parameter."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+import re
+
+from froeling import Parameter
+
+from homeassistant.const import Platform
+
+from .const import LOGGER
+from .store import ParameterInfo
+
+
+def is_binary(parameter: Parameter | ParameterInfo) -> bool:
+    """Return if the parameter is a 0/1 flag."""
+    return (
+        parameter.min_val == "0" and parameter.max_val == "1" and parameter.unit == ""
+    )
+
+
+# Names of read-only values that only grow until they are reset
+_COUNTER_NAME = re.compile(r"(hours|starts|consumption|counter)$", re.IGNORECASE)
+
+
+def is_counter(parameter: Parameter | ParameterInfo) -> bool:
+    """Return if the parameter counts up, like operating hours or pellet consumption."""
+    return (
+        parameter.parameter_type == "NumValueObject"
+        and not parameter.editable
+        and not is_binary(parameter)
+        and (
+            parameter.unit == "h"
+            or _COUNTER_NAME.search(parameter.name or "") is not None
+        )
+    )
+
+
+class ParameterClass(StrEnum):
+    """Kind of a parameter, the options select which kinds become entities."""
+
+    MEASUREMENT = "measurement"
+    STATE = "state"
+    COUNTER = "counter"
+    TIMESTAMP = "timestamp"
+    SETTING = "setting"
+    # Raw numbers and texts without a unit or a list of values
+    OTHER = "other"
+
+
+def parameter_class(parameter: ParameterInfo) -> ParameterClass:
+    """Return the kind of a parameter."""
+    if parameter.editable:
+        return ParameterClass.SETTING
+    if is_counter(parameter):
+        return ParameterClass.COUNTER
+    if is_temporal(parameter):
+        return ParameterClass.TIMESTAMP
+    if is_binary(parameter) or parameter.enum_map is not None:
+        return ParameterClass.STATE
+    if parameter.parameter_type == "NumValueObject" and parameter.unit:
+        return ParameterClass.MEASUREMENT
+    return ParameterClass.OTHER
+
+
+def is_low_value(parameter: ParameterInfo) -> bool:
+    """Return if the entity of a parameter is disabled unless the user enables it."""
+    return parameter_class(parameter) is ParameterClass.OTHER
+
+
+# Parameter types whose values are dates or times
+_TEMPORAL_TYPE = re.compile(r"date|time", re.IGNORECASE)
+
+
+def is_temporal(parameter: Parameter | ParameterInfo) -> bool:
+    """Return if the parameter holds a date, a time or both."""
+    return _TEMPORAL_TYPE.search(parameter.parameter_type or "") is not None
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformRule:
+    """Assigns the parameters it matches to a platform.
+
+    matches is called with the parameter and whether it can be changed,
+    that is whether it is editable and sending changes is enabled.
+    """
+
+    platform: Platform
+    matches: Callable[[ParameterInfo, bool], bool]
+
+
+# The first matching rule wins.
+PLATFORM_RULES: tuple[PlatformRule, ...] = (
+    PlatformRule(
+        Platform.BINARY_SENSOR,
+        lambda p, writable: (
+            p.parameter_type == "NumValueObject" and is_binary(p) and not writable
+        ),
+    ),
+    PlatformRule(
+        Platform.NUMBER,
+        lambda p, writable: (
+            p.parameter_type == "NumValueObject" and not is_binary(p) and writable
+        ),
+    ),
+    PlatformRule(
+        Platform.SELECT,
+        lambda p, writable: (
+            p.parameter_type == "StringValueObject"
+            and p.enum_map is not None
+            and writable
+        ),
+    ),
+    PlatformRule(
+        Platform.SENSOR,
+        lambda p, writable: (
+            p.parameter_type in ("NumValueObject", "StringValueObject") and not writable
+        ),
+    ),
+    # Dates and times are shown, but cannot be set
+    PlatformRule(Platform.SENSOR, lambda p, writable: is_temporal(p)),
+)
+
+
+def classify_parameters(
+    infos: Iterable[ParameterInfo], send_changes: bool
+) -> dict[Platform, list[tuple[int, str, str]]]:
+    """Return the parameter keys that belong to each platform."""
+    index: dict[Platform, list[tuple[int, str, str]]] = {
+        rule.platform: [] for rule in PLATFORM_RULES
+    }
+    for info in infos:
+        writable = bool(info.editable) and send_changes
+        for rule in PLATFORM_RULES:
+            if rule.matches(info, writable):
+                index[rule.platform].append(info.idx)
+                break
+        else:
+            LOGGER.debug(
+                "Parameter %s.%s.%s[%s] not registered. type: %s, editable: %s, min: %s, max: %s, unit: %s, enum: %s",
+                *info.idx,
+                info.name,
+                info.parameter_type,
+                info.editable,
+                info.min_val,
+                info.max_val,
+                info.unit,
+                info.enum_map is not None,
+            )
+    return index
@@ -6,16 +6,51 @@ from collections.abc import Mapping
 from typing import Any
 
 from froeling import Froeling
-from froeling.exceptions import AuthenticationError, NetworkError
+from froeling.exceptions import AuthenticationError
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_LANGUAGE, CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
-from .const import CONF_SEND_CHANGES, DOMAIN, LOGGER
+from .account import account_key, async_fetch_facilities, async_get_account
+from .circuit_breaker import OUTAGE_ERRORS
+from .classification import ParameterClass
+from .const import (
+    CONF_ACTIVE_INTERVAL,
+    CONF_CONNECT_TIMEOUT,
+    CONF_EXPOSED_COMPONENTS,
+    CONF_FAST_INTERVAL,
+    CONF_IDLE_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_PARAMETER_CLASSES,
+    CONF_PUSH_URL,
+    CONF_READ_TIMEOUT,
+    CONF_REQUEST_TIMEOUT,
+    CONF_REQUESTS_PER_SECOND,
+    CONF_SEND_CHANGES,
+    CONF_SLOW_COMPONENTS,
+    CONF_SLOW_INTERVAL,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_SLOW_INTERVAL,
+    DOMAIN,
+    LOGGER,
+)
 from .coordinator import FroelingConnectConfigEntry
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -32,27 +67,36 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    An account that is already set up is checked with its current login.
     """
 
+    account = async_get_account(hass, data[CONF_USERNAME])
     try:
-        api = Froeling(
-            data[CONF_USERNAME],
-            data[CONF_PASSWORD],
-            auto_reauth=False,
-            logger=LOGGER,
-            clientsession=async_create_clientsession(hass),
-        )
-        userdata = await api.login()
-        await api.get_facilities()
+        if account is not None and account.password == data[CONF_PASSWORD]:
+            api = account.client(data[CONF_LANGUAGE])
+            if account.token is None:
+                await account.async_login()
+            async with account.rate_limiter:
+                await async_fetch_facilities(api)
+        else:
+            api = Froeling(
+                data[CONF_USERNAME],
+                data[CONF_PASSWORD],
+                auto_reauth=False,
+                logger=LOGGER,
+                clientsession=async_get_clientsession(hass),
+            )
+            await api.login()
+            await api.get_facilities()
     except AuthenticationError as e:
         raise InvalidAuth from e
-    except NetworkError as e:
+    except OUTAGE_ERRORS as e:
         raise CannotConnect from e
 
     # Return info that you want to store in the config entry.
     return {
-        "user_id": userdata.user_id,
-        CONF_TOKEN: api.session.token,
+        "user_id": api.user_id,
+        CONF_TOKEN: api.token,
     }
 
 
@@ -62,6 +106,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     MINOR_VERSION = 0
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: FroelingConnectConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
@@ -91,29 +143,64 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, entry_data: Mapping[str, Any]
     ) -> config_entries.ConfigFlowResult:
         """Handle a flow initialized by a reauth event."""
-
         LOGGER.info("Reauth")
-        username = entry_data[CONF_USERNAME]
-        password = entry_data[CONF_PASSWORD]
-        entry: FroelingConnectConfigEntry = self.hass.config_entries.async_get_entry(
-            self.context["entry_id"]
-        )
+        return await self.async_step_reauth_confirm()
 
-        api = Froeling(
-            username,
-            password,
-            auto_reauth=False,
-            clientsession=async_create_clientsession(self.hass),
-        )
-        await api.login()
-        assert api.session.token
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Ask for the password and log in with it."""
+        entry: FroelingConnectConfigEntry = self._get_reauth_entry()
+        username = entry.data[CONF_USERNAME]
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            password = user_input[CONF_PASSWORD]
+            api = Froeling(
+                username,
+                password,
+                auto_reauth=False,
+                logger=LOGGER,
+                clientsession=async_get_clientsession(self.hass),
+            )
+            try:
+                await api.login()
+            except AuthenticationError:
+                errors["base"] = "invalid_auth"
+            except OUTAGE_ERRORS:
+                errors["base"] = "cannot_connect"
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                assert api.token
+                self._async_set_credentials(username, password, api.token)
+                return self.async_update_reload_and_abort(
+                    entry,
+                    data={**entry.data, CONF_PASSWORD: password, CONF_TOKEN: api.token},
+                )
 
-        return self.async_update_reload_and_abort(
-            entry,
-            data={**entry.data, CONF_TOKEN: api.session.token},
-            reload_even_if_entry_is_unchanged=False,
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            description_placeholders={CONF_USERNAME: username},
+            errors=errors,
         )
 
+    @callback
+    def _async_set_credentials(self, username: str, password: str, token: str) -> None:
+        """Hand a new login to the account and its other config entries."""
+        if (account := async_get_account(self.hass, username)) is not None:
+            account.set_password(password)
+            account.set_token(token)
+        for other in self.hass.config_entries.async_entries(DOMAIN):
+            if other.entry_id != self.context["entry_id"] and account_key(
+                other.data[CONF_USERNAME]
+            ) == account_key(username):
+                self.hass.config_entries.async_update_entry(
+                    other,
+                    data={**other.data, CONF_PASSWORD: password, CONF_TOKEN: token},
+                )
+
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
@@ -139,6 +226,112 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Fröling Connect options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            if not user_input.get(CONF_SLOW_COMPONENTS):
+                # Nothing chosen, the coordinator detects the slow components
+                user_input.pop(CONF_SLOW_COMPONENTS, None)
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema: dict[Any, Any] = {
+            vol.Required(
+                CONF_REQUESTS_PER_SECOND,
+                default=options.get(
+                    CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=20)),
+            vol.Required(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                default=options.get(
+                    CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+            vol.Required(
+                CONF_REQUEST_TIMEOUT,
+                default=options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+            vol.Required(
+                CONF_CONNECT_TIMEOUT,
+                default=options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+            vol.Required(
+                CONF_READ_TIMEOUT,
+                default=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+            vol.Required(
+                CONF_FAST_INTERVAL,
+                default=options.get(CONF_FAST_INTERVAL, DEFAULT_FAST_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Required(
+                CONF_ACTIVE_INTERVAL,
+                default=options.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Required(
+                CONF_IDLE_INTERVAL,
+                default=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Required(
+                CONF_SLOW_INTERVAL,
+                default=options.get(CONF_SLOW_INTERVAL, DEFAULT_SLOW_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+            vol.Optional(
+                CONF_PARAMETER_CLASSES,
+                default=options.get(
+                    CONF_PARAMETER_CLASSES, [c.value for c in ParameterClass]
+                ),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[c.value for c in ParameterClass],
+                    multiple=True,
+                    mode=SelectSelectorMode.LIST,
+                    translation_key=CONF_PARAMETER_CLASSES,
+                )
+            ),
+            vol.Optional(
+                CONF_PUSH_URL,
+                description={"suggested_value": options.get(CONF_PUSH_URL)},
+            ): vol.All(cv.string, vol.Match(r"^wss?://")),
+        }
+
+        detected = "-"
+        if self.config_entry.state is config_entries.ConfigEntryState.LOADED:
+            coordinator = self.config_entry.runtime_data
+            components = {
+                f"{fid}_{cid}": component.display_name or cid
+                for fid, facility_components in coordinator.components.items()
+                for cid, component in facility_components.items()
+            }
+            if coordinator.slow_components:
+                detected = ", ".join(
+                    components.get(key, key) for key in coordinator.slow_components
+                )
+            schema[
+                vol.Optional(
+                    CONF_SLOW_COMPONENTS,
+                    default=options.get(CONF_SLOW_COMPONENTS, []),
+                )
+            ] = cv.multi_select(components)
+            schema[
+                vol.Optional(
+                    CONF_EXPOSED_COMPONENTS,
+                    default=options.get(CONF_EXPOSED_COMPONENTS, list(components)),
+                )
+            ] = cv.multi_select(components)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(schema),
+            description_placeholders={"slow_components": detected},
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
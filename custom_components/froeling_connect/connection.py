@@ -0,0 +1,171 @@
+"""HTTP connections of the Froeling Connect integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsCacheHitParams,
+    TraceDnsCacheMissParams,
+    TraceRequestEndParams,
+    hdrs,
+)
+
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    CONF_CONNECT_TIMEOUT,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_READ_TIMEOUT,
+    CONNECTION_DNS_CACHE_TTL,
+    CONNECTION_KEEPALIVE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_READ_TIMEOUT,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionProfile:
+    """How the HTTP connections of an account are made and kept."""
+
+    pool_size: int
+    connect_timeout: float
+    read_timeout: float
+    keepalive: float = CONNECTION_KEEPALIVE
+    dns_cache_ttl: int = CONNECTION_DNS_CACHE_TTL
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> ConnectionProfile:
+        """Take the profile from the options of a config entry.
+
+        The pool fits the concurrent requests and the push channel.
+        """
+        return cls(
+            pool_size=options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
+            + 1,
+            connect_timeout=options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+            read_timeout=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile for diagnostics."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    """Counters of the HTTP requests and connections of an account."""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+    compressed_responses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Return the share of requests sent over a kept-alive connection."""
+        if not (connections := self.connections_created + self.connections_reused):
+            return None
+        return round(self.connections_reused / connections, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {**asdict(self), "reuse_ratio": self.reuse_ratio}
+
+    def trace_config(self) -> TraceConfig:
+        """Return a trace config that counts into these stats."""
+        trace_config = TraceConfig()
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    async def _on_request_end(
+        self,
+        _session: ClientSession,
+        _ctx: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        self.requests += 1
+        if hdrs.CONTENT_ENCODING in params.response.headers:
+            self.compressed_responses += 1
+
+    async def _on_connection_create_end(
+        self,
+        _session: ClientSession,
+        _ctx: SimpleNamespace,
+        _params: TraceConnectionCreateEndParams,
+    ) -> None:
+        self.connections_created += 1
+
+    async def _on_connection_reuseconn(
+        self,
+        _session: ClientSession,
+        _ctx: SimpleNamespace,
+        _params: TraceConnectionReuseconnParams,
+    ) -> None:
+        self.connections_reused += 1
+
+    async def _on_dns_cache_hit(
+        self,
+        _session: ClientSession,
+        _ctx: SimpleNamespace,
+        _params: TraceDnsCacheHitParams,
+    ) -> None:
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(
+        self,
+        _session: ClientSession,
+        _ctx: SimpleNamespace,
+        _params: TraceDnsCacheMissParams,
+    ) -> None:
+        self.dns_cache_misses += 1
+
+
+def create_clientsession(
+    profile: ConnectionProfile, stats: ConnectionStats
+) -> ClientSession:
+    """Create the HTTP session of an account.
+
+    Unlike the shared session of Home Assistant, it keeps a small pool of
+    connections alive between polls, caches the address of the cloud and
+    limits connecting and reading separately. Compressed responses are
+    asked for and unpacked by aiohttp. The owner has to close it.
+    """
+    connector = TCPConnector(
+        limit=profile.pool_size,
+        limit_per_host=profile.pool_size,
+        keepalive_timeout=profile.keepalive,
+        use_dns_cache=True,
+        ttl_dns_cache=profile.dns_cache_ttl,
+        ssl=get_default_context(),
+    )
+    return ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(
+            total=None,
+            sock_connect=profile.connect_timeout,
+            sock_read=profile.read_timeout,
+        ),
+        headers={hdrs.USER_AGENT: SERVER_SOFTWARE},
+        auto_decompress=True,
+        trace_configs=[stats.trace_config()],
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 from typing import Final
 
@@ -11,9 +12,94 @@ DOMAIN: Final = "froeling_connect"
 LOGGER: Final[logging.Logger] = logging.getLogger(__package__)
 PLATFORMS: Final[list[Platform]] = [
     Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
     Platform.NUMBER,
     Platform.SELECT,
     Platform.SENSOR,
 ]
 ATTRIBUTION: Final = "Data provided by Froeling Connect"
+
+SERVICE_SET_PARAMETERS: Final = "set_parameters"
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+ATTR_PARAMETERS: Final = "parameters"
+ATTR_FACILITY_ID: Final = "facility_id"
+ATTR_COMPONENT_ID: Final = "component_id"
+ATTR_PARAMETER_ID: Final = "parameter_id"
+ATTR_VALUE: Final = "value"
 CONF_SEND_CHANGES: Final = "send_changes"
+
+CONF_REQUESTS_PER_SECOND: Final = "requests_per_second"
+CONF_MAX_CONCURRENT_REQUESTS: Final = "max_concurrent_requests"
+CONF_REQUEST_TIMEOUT: Final = "request_timeout"
+CONF_CONNECT_TIMEOUT: Final = "connect_timeout"
+CONF_READ_TIMEOUT: Final = "read_timeout"
+
+DEFAULT_REQUESTS_PER_SECOND: Final = 2.0
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final = 4
+DEFAULT_REQUEST_TIMEOUT: Final = 10
+DEFAULT_CONNECT_TIMEOUT: Final = 5
+DEFAULT_READ_TIMEOUT: Final = 10
+# Idle connections are kept this long, polls usually come sooner
+CONNECTION_KEEPALIVE: Final = 30
+# Seconds the address of the cloud is cached
+CONNECTION_DNS_CACHE_TTL: Final = 300
+REQUEST_BURST: Final = 4
+# Log in again this long before the token expires
+TOKEN_REFRESH_MARGIN: Final = timedelta(minutes=10)
+TOKEN_RETRY_DELAY: Final = timedelta(minutes=1)
+# Requests failing in a row before requests are paused
+BREAKER_FAILURE_THRESHOLD: Final = 3
+BREAKER_BASE_DELAY: Final = timedelta(seconds=30)
+BREAKER_MAX_DELAY: Final = timedelta(minutes=30)
+BREAKER_JITTER: Final = 0.2
+STALE_AFTER_MISSED_POLLS: Final = 3
+
+CONF_FAST_INTERVAL: Final = "fast_interval"
+CONF_SLOW_INTERVAL: Final = "slow_interval"
+CONF_SLOW_COMPONENTS: Final = "slow_components"
+
+DEFAULT_FAST_INTERVAL: Final = 30
+DEFAULT_SLOW_INTERVAL: Final = 600
+MIN_UPDATE_INTERVAL: Final = timedelta(seconds=5)
+
+# Components and parameter classes that become entities, all if not set
+CONF_EXPOSED_COMPONENTS: Final = "exposed_components"
+CONF_PARAMETER_CLASSES: Final = "parameter_classes"
+
+CONF_ACTIVE_INTERVAL: Final = "active_interval"
+CONF_IDLE_INTERVAL: Final = "idle_interval"
+
+DEFAULT_ACTIVE_INTERVAL: Final = 15
+DEFAULT_IDLE_INTERVAL: Final = 120
+ACTIVITY_IDLE_AFTER: Final = 3
+
+# Sent with the parameter keys added to and removed from a platform,
+# formatted with the config entry id and the platform
+SIGNAL_PARAMETERS_CHANGED: Final = f"{DOMAIN}_parameters_changed_{{}}_{{}}"
+# How often the facilities and components are checked for changes
+DISCOVERY_INTERVAL: Final = timedelta(hours=6)
+# Retry of the check of a discovery restored from the cache
+DISCOVERY_RETRY_DELAY: Final = timedelta(minutes=5)
+
+# Fired when an error or alarm of a facility appears or clears
+EVENT_ERROR: Final = f"{DOMAIN}_error"
+ERROR_POLL_INTERVAL: Final = timedelta(minutes=1)
+# Config entries of an account checking the errors within this time share
+# one fetch of the notifications
+NOTIFICATION_MAX_AGE: Final = ERROR_POLL_INTERVAL - timedelta(seconds=5)
+
+# Websocket sending parameter changes, see push.PushListener
+CONF_PUSH_URL: Final = "push_url"
+# Seconds without a message after which the push channel counts as quiet
+PUSH_QUIET_AFTER: Final = 120
+PUSH_HEARTBEAT: Final = 30
+PUSH_RECONNECT_DELAY: Final = 5
+PUSH_MAX_RECONNECT_DELAY: Final = 600
+
+WRITE_DEBOUNCE: Final = 1.0
+# The recorder compiles statistics every five minutes, counter values in
+# between would only add state rows
+COUNTER_WRITE_INTERVAL: Final = timedelta(minutes=5)
+WRITE_CONFIRM_DELAY: Final = 5
+# The cloud gives no step or precision, numbers are set in whole steps
+NUMBER_STEP: Final = 1
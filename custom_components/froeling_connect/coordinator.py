@@ -3,32 +3,108 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from datetime import timedelta
-import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
+import time
+from typing import Any
 
 from froeling import Component, Facility, Froeling, Parameter
-from froeling.exceptions import AuthenticationError, NetworkError
+from froeling.exceptions import AuthenticationError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_LANGUAGE, CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.const import CONF_LANGUAGE, CONF_TOKEN, Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    HomeAssistantError,
+)
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOGGER
+from .account import (
+    async_acquire_account,
+    async_fetch_facilities,
+    async_release_account,
+)
+from .activity import ActivityTracker, is_active
+from .cache import DiscoveryCache, component_from_dict, facility_to_dict
+from .circuit_breaker import OUTAGE_ERRORS, is_outage
+from .classification import ParameterClass, classify_parameters, parameter_class
+from .const import (
+    ACTIVITY_IDLE_AFTER,
+    CONF_ACTIVE_INTERVAL,
+    CONF_EXPOSED_COMPONENTS,
+    CONF_FAST_INTERVAL,
+    CONF_IDLE_INTERVAL,
+    CONF_PARAMETER_CLASSES,
+    CONF_PUSH_URL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SEND_CHANGES,
+    CONF_SLOW_COMPONENTS,
+    CONF_SLOW_INTERVAL,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SLOW_INTERVAL,
+    DISCOVERY_INTERVAL,
+    DISCOVERY_RETRY_DELAY,
+    DOMAIN,
+    ERROR_POLL_INTERVAL,
+    LOGGER,
+    MIN_UPDATE_INTERVAL,
+    PLATFORMS,
+    SIGNAL_PARAMETERS_CHANGED,
+    STALE_AFTER_MISSED_POLLS,
+    WRITE_CONFIRM_DELAY,
+    WRITE_DEBOUNCE,
+)
+from .errors import ErrorMonitor
+from .metrics import CycleRecord, PollMetrics
+from .push import PushListener
+from .schedule import WeeklySchedule
+from .scheduler import PollScheduler
+from .store import ParameterStore
+from .write_queue import ParameterWriteQueue
 
 type FroelingConnectConfigEntry = ConfigEntry[FroelingConnectDataUpdateCoordinator]
 
 
+def _values_match(value: str | None, expected: str) -> bool:
+    """Return if a polled value equals a written one, ignoring number formatting."""
+    try:
+        return float(value) == float(expected)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return str(value) == expected
+
+
+@dataclass
+class ComponentStatus:
+    """Freshness of the data of a single component."""
+
+    last_update: datetime | None = None
+    stale: bool = True
+    last_error: str | None = None
+
+
 @dataclass
 class FroelingConnectCoordinatorData:
     """Data Type of FroelingConnectDataUpdateCoordinator's data."""
 
-    parameters: dict[tuple[int, str, str], Parameter]
+    components: dict[tuple[int, str], ComponentStatus] = field(default_factory=dict)
+    # Store slots of the parameters whose value or availability changed
+    # in the last refresh
+    changed: set[int] = field(default_factory=set)
+    # Components whose schedule changed in the last refresh
+    changed_schedules: set[tuple[int, str]] = field(default_factory=set)
 
 
 class FroelingConnectDataUpdateCoordinator(
@@ -45,75 +121,931 @@ class FroelingConnectDataUpdateCoordinator(
             hass,
             LOGGER,
             name=name,
-            update_interval=timedelta(seconds=60),
+            update_interval=timedelta(seconds=DEFAULT_FAST_INTERVAL),
         )
 
-        self.update_interval = timedelta(seconds=30)
+        self.facilities: list[dict[str, Any]] = []
         self.components: dict[int, dict[str, Component]] = {}
-        self.data = FroelingConnectCoordinatorData({})
+        self.data = FroelingConnectCoordinatorData()
+        # Parameter values and metadata, updated in place by every refresh
+        self.store = ParameterStore()
         self.component_device_info: dict[tuple[int, str], DeviceInfo] = {}
+        # Time windows of the components that have them
+        self.schedules: dict[tuple[int, str], WeeklySchedule] = {}
+
+        options = self.config_entry.options
+        self.applied_options = dict(options)
+        self.metrics = PollMetrics()
+        self.account = async_acquire_account(hass, self.config_entry)
+        self._remove_request_listener = self.account.async_add_request_listener(
+            self.metrics.record_request
+        )
+        self._remove_token_listener = self.account.async_add_token_listener(
+            self._handle_new_token
+        )
+        self.rate_limiter = self.account.rate_limiter
+        self.request_timeout: float = options.get(
+            CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+        )
+
+        self.scheduler = PollScheduler()
+        self.fast_interval = timedelta(
+            seconds=options.get(CONF_FAST_INTERVAL, DEFAULT_FAST_INTERVAL)
+        )
+        self.slow_interval = timedelta(
+            seconds=options.get(CONF_SLOW_INTERVAL, DEFAULT_SLOW_INTERVAL)
+        )
+        self.active_interval = timedelta(
+            seconds=options.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL)
+        )
+        self.idle_interval = timedelta(
+            seconds=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL)
+        )
+        self.update_interval = self.fast_interval
+        # None: decide per component, see _get_poll_interval
+        self._configured_slow_components: set[str] | None = (
+            set(options[CONF_SLOW_COMPONENTS])
+            if CONF_SLOW_COMPONENTS in options
+            else None
+        )
+        self._slow_components: set[tuple[int, str]] = set()
+        # None: expose all, see _index_parameters
+        self._exposed_components: set[str] | None = (
+            set(options[CONF_EXPOSED_COMPONENTS])
+            if CONF_EXPOSED_COMPONENTS in options
+            else None
+        )
+        self._parameter_classes: set[ParameterClass] | None = (
+            {ParameterClass(c) for c in options[CONF_PARAMETER_CLASSES]}
+            if CONF_PARAMETER_CLASSES in options
+            else None
+        )
+        self.activity: dict[int, ActivityTracker] = {}
+        # Entities notified of a change in the last refresh, per facility
+        self.notified_entities: Counter[int] = Counter()
+        self.cache = DiscoveryCache(hass, self.config_entry.entry_id)
+        # Parameter keys per platform, see classification.PLATFORM_RULES
+        self.platform_index: dict[Platform, list[tuple[int, str, str]]] = {}
+        self._indexed_layout: int | None = None
+        self.write_queue = ParameterWriteQueue(
+            hass, self._async_request, WRITE_DEBOUNCE
+        )
+        # Written values that a poll has not confirmed yet
+        self.pending_writes: dict[tuple[int, str, str], str] = {}
+        self._writes_in_flight: Counter[tuple[int, str, str]] = Counter()
+        # The confirmation timer of a component and the components it polls
+        self._confirm_timers: dict[
+            tuple[int, str], tuple[CALLBACK_TYPE, set[tuple[int, str]]]
+        ] = {}
+        # Components polled to confirm written values
+        self._confirming: set[tuple[int, str]] = set()
+        self.push: PushListener | None = None
+        self.errors = ErrorMonitor(hass, self.config_entry.entry_id)
 
     async def async_setup(self) -> None:
         """Set up the coordinator."""
-        self.froeling = Froeling(
-            username=self.config_entry.data[CONF_USERNAME],
-            password=self.config_entry.data[CONF_PASSWORD],
-            token=self.config_entry.data[CONF_TOKEN],
-            auto_reauth=False,
-            language=self.config_entry.data[CONF_LANGUAGE],
-            logger=LOGGER,
-            clientsession=async_create_clientsession(self.hass),
+        self.froeling = self.account.client(self.config_entry.data[CONF_LANGUAGE])
+        self.config_entry.async_on_unload(
+            async_track_time_interval(
+                self.hass, self._handle_discovery_due, DISCOVERY_INTERVAL
+            )
         )
+        self.config_entry.async_on_unload(
+            async_track_time_interval(
+                self.hass, self._handle_errors_due, ERROR_POLL_INTERVAL
+            )
+        )
+        if push_url := self.config_entry.options.get(CONF_PUSH_URL):
+            self.push = PushListener(
+                self.account.clientsession,
+                push_url,
+                self._handle_push,
+                self._handle_push_live,
+            )
+            self.config_entry.async_create_background_task(
+                self.hass, self.push.async_run(), f"{DOMAIN} {self.name} push"
+            )
+
+        if (
+            cached := await self.cache.async_load(self.config_entry.data[CONF_LANGUAGE])
+        ) is not None:
+            self._set_discovery(
+                cached["facilities"],
+                [
+                    component_from_dict(component, self.froeling.session)
+                    for component in cached["components"]
+                ],
+            )
+            for facility_components in self.components.values():
+                for component in facility_components.values():
+                    self.store.update_component(
+                        (component.facility_id, component.component_id),
+                        component.parameters,
+                    )
+            for component in cached["components"]:
+                key = (component["facility_id"], component["component_id"])
+                if component.get("time_windows") and self._is_exposed_component(key):
+                    self.schedules[key] = WeeklySchedule(component["time_windows"])
+            self._index_parameters()
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_refresh_cached_discovery(),
+                f"{DOMAIN} {self.name} refresh cached discovery",
+            )
+            self._handle_errors_due()
+            return
 
         try:
-            facilities: list[Facility] = await self.froeling.get_facilities()
-            for facility in facilities:
-                self._register_facility_device_info(facility)
-                components = await facility.get_components()
-                for component in components:
-                    if component:
-                        self.component_device_info[
-                            (component.facility_id, component.component_id)
-                        ] = self._get_component_device_info(component)
-                component_dict = {c.component_id: c for c in components if c}
-                self.components[facility.facility_id] = component_dict
+            self._set_discovery(*await self._async_discover())
         except AuthenticationError as e:
             raise ConfigEntryAuthFailed from e
+        except OUTAGE_ERRORS as e:
+            raise ConfigEntryNotReady(repr(e)) from e
 
         await self.async_config_entry_first_refresh()
-        self._check_unregistered_parameters()
+        self._handle_errors_due()
+
+    async def _async_discover(
+        self,
+    ) -> tuple[list[dict[str, Any]], list[Component]]:
+        """Fetch the facilities and their components.
+
+        The components of all facilities are fetched concurrently within the
+        request budget. Nothing is registered here, see _set_discovery.
+        """
+        facilities: list[Facility] = await self._async_request(
+            partial(async_fetch_facilities, self.froeling)
+        )
+        facility_components: list[list[Component]] = await asyncio.gather(
+            *(self._async_request(facility.get_components) for facility in facilities)
+        )
+        components = [c for found in facility_components for c in found if c]
+        return [facility_to_dict(facility) for facility in facilities], components
+
+    def _set_discovery(
+        self, facilities: list[dict[str, Any]], components: list[Component]
+    ) -> None:
+        """Register the discovered facilities and components."""
+        self.facilities = facilities
+        for facility in facilities:
+            self._register_facility_device_info(facility)
+            self.components[facility["facility_id"]] = {}
+        for component in components:
+            key = (component.facility_id, component.component_id)
+            self.components[key[0]][key[1]] = component
+            self.component_device_info[key] = self._get_component_device_info(component)
+            if not self._is_exposed_component(key):
+                # Removes the entities of the component as well
+                self._remove_component_device(key)
+
+    async def _async_refresh_cached_discovery(self) -> None:
+        """Refresh the data restored from the cache and check it against the cloud.
+
+        The cache is used when the cloud could not be reached, so a failed
+        check is retried instead of waiting for the next discovery.
+        """
+        await self.async_refresh()
+        if not await self._async_check_discovery():
+            self.config_entry.async_on_unload(
+                async_call_later(
+                    self.hass, DISCOVERY_RETRY_DELAY, self._handle_cached_check_due
+                )
+            )
+
+    @callback
+    def _handle_cached_check_due(self, _now: datetime) -> None:
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_refresh_cached_discovery(),
+            f"{DOMAIN} {self.name} check cached discovery",
+        )
+
+    @callback
+    def _handle_discovery_due(self, _now: datetime) -> None:
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_check_discovery(),
+            f"{DOMAIN} {self.name} check discovery",
+        )
+
+    @callback
+    def _handle_errors_due(self, _now: datetime | None = None) -> None:
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_update_errors(), f"{DOMAIN} {self.name} errors"
+        )
+
+    async def _async_update_errors(self) -> None:
+        """Report the errors and alarms that appeared or cleared.
+
+        Runs on its own, shorter schedule than the parameters. Failures are
+        left to the refresh of the parameters to report.
+        """
+        try:
+            notifications = await self.account.async_get_notifications(
+                self.config_entry.data[CONF_LANGUAGE], self._async_request
+            )
+        except (AuthenticationError, *OUTAGE_ERRORS) as e:
+            LOGGER.debug("Could not fetch the errors: %r", e)
+            return
+        self.errors.async_update(
+            notifications, {facility["facility_id"] for facility in self.facilities}
+        )
+
+    async def _async_check_discovery(self) -> bool:
+        """Check the facilities and components against the cloud.
+
+        Added and removed components are taken over in place, the platforms
+        follow with the parameters of the next refresh. If the facilities
+        changed, the cache is dropped and the config entry reloaded, which
+        runs a full discovery. Returns False if the cloud could not be asked.
+        """
+        try:
+            facilities, components = await self._async_discover()
+        except (AuthenticationError, *OUTAGE_ERRORS) as e:
+            LOGGER.warning("Could not check the facilities: %r", e)
+            return False
+
+        if facilities != self.facilities:
+            LOGGER.info("Facilities changed, reloading")
+            await self.cache.async_remove()
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+            return True
+
+        discovered = {(c.facility_id, c.component_id): c for c in components}
+        known = {
+            (fid, cid)
+            for fid, facility_components in self.components.items()
+            for cid in facility_components
+        }
+        if discovered.keys() == known:
+            return True
+
+        for key in known - discovered.keys():
+            self._remove_component(key)
+        for key in discovered.keys() - known:
+            component = discovered[key]
+            LOGGER.info("Adding component %s", component.display_name)
+            self.components[key[0]][key[1]] = component
+            self.component_device_info[key] = self._get_component_device_info(component)
+        if self.store.layout_version != self._indexed_layout:
+            self._index_parameters()
+        self._async_schedule_cache_save()
+        # Poll the new components right away
+        await self.async_refresh()
+        return True
+
+    def _remove_component(self, key: tuple[int, str]) -> None:
+        """Forget a component that no longer exists and remove its device."""
+        component = self.components[key[0]].pop(key[1])
+        LOGGER.info("Removing component %s", component.display_name)
+        self.component_device_info.pop(key, None)
+        self.schedules.pop(key, None)
+        self.scheduler.remove(key)
+        self._slow_components.discard(key)
+        self._confirming.discard(key)
+        self._cancel_confirmation(key)
+        self.store.update_component(key, {})
+        self.data.components.pop(key, None)
+        self._remove_component_device(key)
+
+    def _remove_component_device(self, key: tuple[int, str]) -> None:
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, "component", key[0], key[1])}
+        ):
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.config_entry.entry_id
+            )
+
+    @callback
+    def _async_schedule_cache_save(self) -> None:
+        """Save the facilities and components for the next start."""
+        self.cache.async_schedule_save(
+            self.config_entry.data[CONF_LANGUAGE],
+            self.facilities,
+            [
+                component
+                for facility_components in self.components.values()
+                for component in facility_components.values()
+            ],
+        )
 
     async def _async_update_data(self) -> FroelingConnectCoordinatorData:
         """Fetch data from Froeling API."""
+        now = dt_util.utcnow()
+        if (retry_in := self.account.breaker.time_until_retry(now)) is not None:
+            # Back off until the breaker lets a probe through
+            self.update_interval = max(retry_in, MIN_UPDATE_INTERVAL)
+            raise UpdateFailed(
+                f"Froeling Connect is unavailable, next attempt in {retry_in}"
+            )
+        started = time.monotonic()
+        keys = self._polled_components()
+        due = self.scheduler.due(keys, now)
+        components = [self.components[fid][cid] for fid, cid in due]
+        durations: dict[str, float] = {}
+        results = await asyncio.gather(
+            *(
+                self._async_update_component(component, durations)
+                for component in components
+            ),
+            return_exceptions=True,
+        )
+
+        statuses = dict(self.data.components)
+        for component, result in zip(components, results, strict=True):
+            if isinstance(result, AuthenticationError):
+                raise ConfigEntryAuthFailed from result
+            if isinstance(result, BaseException) and not isinstance(
+                result, OUTAGE_ERRORS
+            ):
+                raise result
+
+            key = (component.facility_id, component.component_id)
+            previous = self.data.components.get(key, ComponentStatus())
+            if isinstance(result, BaseException):
+                LOGGER.debug("Error pulling %s: %r", component.display_name, result)
+                if key not in self.scheduler:
+                    self.scheduler.set_interval(
+                        key, self.facility_poll_interval(component.facility_id)
+                    )
+                stale_after = self.scheduler.interval(key) * STALE_AFTER_MISSED_POLLS
+                status = ComponentStatus(
+                    last_update=previous.last_update,
+                    stale=previous.last_update is None
+                    or now - previous.last_update > stale_after,
+                    last_error=repr(result),
+                )
+                self.metrics.record_error(status.last_error, now)
+                if status.stale and not previous.stale:
+                    LOGGER.warning(
+                        "Data of %s is stale: %s",
+                        component.display_name,
+                        status.last_error,
+                    )
+            else:
+                status = ComponentStatus(last_update=now, stale=False)
+                if previous.last_update is None:
+                    self.scheduler.set_interval(key, self._get_poll_interval(component))
+                elif previous.stale:
+                    LOGGER.info(
+                        "Data of %s is up to date again", component.display_name
+                    )
+            statuses[key] = status
+            self.scheduler.mark_polled(key, now)
+
+        polled = {
+            (component.facility_id, component.component_id)
+            for component, result in zip(components, results, strict=True)
+            if not isinstance(result, BaseException)
+        }
+        changed = self._update_store(polled, statuses)
+        changed_schedules = self._update_schedules(polled)
+        self.metrics.record_cycle(
+            CycleRecord(
+                start=now,
+                duration=time.monotonic() - started,
+                polled=len(components),
+                errors=len(components) - len(polled),
+                changed=len(changed),
+                component_durations=durations,
+            )
+        )
+        for fid in {fid for fid, _ in polled}:
+            self._update_activity(fid)
+
+        # Components that are not polled must not pull the next cycle forward
+        next_poll = self.scheduler.time_until_next_poll(
+            self._polled_components(), dt_util.utcnow()
+        )
+        self.update_interval = max(
+            self.fast_interval if next_poll is None else next_poll,
+            MIN_UPDATE_INTERVAL,
+            self.account.breaker.time_until_retry(dt_util.utcnow()) or timedelta(0),
+        )
+
+        if keys and all(
+            (status := statuses.get(key)) is None or status.stale for key in keys
+        ):
+            errors = {status.last_error for status in statuses.values()}
+            raise UpdateFailed(
+                f"Error pulling components: {', '.join(sorted(filter(None, errors)))}"
+            )
+
+        if self.store.layout_version != self._indexed_layout:
+            self._index_parameters()
+            self._async_schedule_cache_save()
+
+        self._count_notified_entities(changed)
+
+        return FroelingConnectCoordinatorData(
+            components=statuses, changed=changed, changed_schedules=changed_schedules
+        )
+
+    def _update_schedules(self, polled: set[tuple[int, str]]) -> set[tuple[int, str]]:
+        """Rebuild the schedules whose raw time windows changed.
+
+        Returns the components whose schedule changed.
+        """
+        changed = set()
+        for key in polled:
+            days = self.components[key[0]][key[1]].time_windows_view
+            raw = [day.raw for day in days] if days else []
+            if (schedule := self.schedules.get(key)) is None:
+                if not raw:
+                    continue
+            elif schedule.raw == raw:
+                continue
+            if raw:
+                self.schedules[key] = WeeklySchedule(raw)
+            else:
+                del self.schedules[key]
+            changed.add(key)
+        return changed
+
+    def _count_notified_entities(self, changed: set[int]) -> None:
+        """Count the entities notified of the changed slots per facility."""
+        self.notified_entities = Counter(
+            idx[0]
+            for idx in self.async_contexts()
+            if self.store.get_slot(idx) in changed
+        )
+
+    @callback
+    def _handle_push(self, key: tuple[int, str], values: dict[str, str | None]) -> None:
+        """Apply parameter values received over the push channel.
+
+        The component counts as polled, so its next poll is postponed.
+        """
+        if (component := self.components.get(key[0], {}).get(key[1])) is None:
+            return
+        pushed = False
+        for parameter_id, value in values.items():
+            if (parameter := component.parameters.get(parameter_id)) is not None:
+                parameter.value = value
+                pushed = True
+        if not pushed:
+            return
+
+        now = dt_util.utcnow()
+        status = ComponentStatus(last_update=now, stale=False)
+        changed = self._update_store({key}, {key: status})
+        self.scheduler.mark_polled(key, now)
+        self._update_activity(key[0])
+        self._count_notified_entities(changed)
+        # Unlike async_set_updated_data, this keeps the refresh schedule
+        self.data = FroelingConnectCoordinatorData(
+            components={**self.data.components, key: status}, changed=changed
+        )
+        self.async_update_listeners()
+
+    @callback
+    def _handle_push_live(self, live: bool) -> None:
+        """Poll at the slow interval while the push channel delivers changes."""
+        for fid, facility_components in self.components.items():
+            for cid, component in facility_components.items():
+                if (fid, cid) in self.scheduler:
+                    self.scheduler.set_interval(
+                        (fid, cid), self._get_poll_interval(component)
+                    )
+        if not live:
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_refresh(), f"{DOMAIN} {self.name} push quiet"
+            )
+
+    def _update_store(
+        self,
+        polled: set[tuple[int, str]],
+        statuses: dict[tuple[int, str], ComponentStatus],
+    ) -> set[int]:
+        """Copy the polled values into the store.
+
+        Returns the slots whose value, availability or pending state changed.
+        """
+        store = self.store
+        pending_before = {
+            slot: store.values[slot]
+            for idx in self.pending_writes
+            if (slot := store.get_slot(idx)) is not None
+        }
+        changed: set[int] = set()
+        for key in polled:
+            # Component.parameters holds the result of the poll
+            changed |= store.update_component(
+                key, self.components[key[0]][key[1]].parameters
+            )
+
+        resolved = self._resolve_pending_writes(polled)
+        for idx, value in self.pending_writes.items():
+            if (slot := store.get_slot(idx)) is not None:
+                store.values[slot] = value
+        for slot, value in pending_before.items():
+            if store.values[slot] == value:
+                changed.discard(slot)
+            else:
+                changed.add(slot)
+        changed.update(
+            slot for idx in resolved if (slot := store.get_slot(idx)) is not None
+        )
+
+        for key, status in statuses.items():
+            if (
+                previous := self.data.components.get(key)
+            ) is None or previous.stale != status.stale:
+                changed.update(store.component_slots(key))
+        return changed
+
+    def _polled_components(self) -> list[tuple[int, str]]:
+        """Return the components that are polled.
+
+        A component is polled until its parameters are known. After that,
+        only while an enabled entity shows one of its parameters or a
+        written value has to be confirmed.
+        """
+        shown = {(idx[0], idx[1]) for idx in self.async_contexts() if idx is not None}
+        keys = []
+        for fid, facility_components in self.components.items():
+            for cid in facility_components:
+                key = (fid, cid)
+                if not self._is_exposed_component(key):
+                    continue
+                if (
+                    key in shown
+                    or key in self._confirming
+                    or (status := self.data.components.get(key)) is None
+                    or status.last_update is None
+                ):
+                    keys.append(key)
+        return keys
+
+    def _is_exposed_component(self, key: tuple[int, str]) -> bool:
+        """Return if the options let the parameters of a component become entities."""
+        return (
+            self._exposed_components is None
+            or f"{key[0]}_{key[1]}" in self._exposed_components
+        )
+
+    def _index_parameters(self) -> None:
+        """Rebuild the lookups that only change with the set of parameters.
+
+        Parameters excluded by the options get no entity, the registry
+        entries of excluded parameter classes are removed. Once the
+        platforms are set up, they are sent the parameters they have to add
+        and remove entities for.
+        """
+        exposed = []
+        excluded = []
+        for info in self.store.infos():
+            if not self._is_exposed_component((info.idx[0], info.idx[1])):
+                continue
+            if (
+                self._parameter_classes is None
+                or parameter_class(info) in self._parameter_classes
+            ):
+                exposed.append(info)
+            else:
+                excluded.append(info.idx)
+        previous = self.platform_index
+        self.platform_index = classify_parameters(
+            exposed, self.config_entry.data[CONF_SEND_CHANGES]
+        )
+        self._indexed_layout = self.store.layout_version
+        if excluded:
+            self._remove_excluded_entities(excluded)
+        if not previous:
+            return
+        for platform in previous.keys() | self.platform_index.keys():
+            keys = self.platform_index.get(platform, [])
+            previous_keys = set(previous.get(platform, ()))
+            added = [idx for idx in keys if idx not in previous_keys]
+            removed = previous_keys.difference(keys)
+            if not added and not removed:
+                continue
+            LOGGER.debug(
+                "%s: %d parameters added, %d removed",
+                platform,
+                len(added),
+                len(removed),
+            )
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_PARAMETERS_CHANGED.format(self.config_entry.entry_id, platform),
+                added,
+                removed,
+            )
+
+    def _remove_excluded_entities(self, excluded: list[tuple[int, str, str]]) -> None:
+        """Remove the registry entries of parameters the options exclude."""
+        entity_registry = er.async_get(self.hass)
+        for idx in excluded:
+            unique_id = f"{idx[0]}_{idx[1]}_{idx[2]}"
+            for platform in PLATFORMS:
+                if entity_id := entity_registry.async_get_entity_id(
+                    platform, DOMAIN, unique_id
+                ):
+                    LOGGER.debug("Removing excluded entity %s", entity_id)
+                    entity_registry.async_remove(entity_id)
+
+    async def async_set_parameter(
+        self, idx: tuple[int, str, str], value: str, confirm: bool = True
+    ) -> Any:
+        """Write a parameter through the write queue and return the result.
+
+        The value is shown as pending right away. Once it is written, the
+        component is polled after a short delay to confirm it, unless the
+        caller schedules the confirmation itself.
+        """
+        parameter = self.components[idx[0]][idx[1]].parameters[idx[2]]
+        self.pending_writes[idx] = value
+        self._writes_in_flight[idx] += 1
+        self._async_publish_pending({idx})
+
+        written = False
         try:
-            async with asyncio.timeout(10):
-                parameters_out = {}
-                for fid, components in self.components.items():
-                    for component in components.values():
-                        parameters = await component.update()
-                        LOGGER.debug("Pulling %s", component.display_name)
-                        await asyncio.sleep(0.5)  # Ratelimit
-                        for parameter in parameters.values():
-                            parameters_out[
-                                (fid, component.component_id, parameter.id)
-                            ] = parameter
-            return FroelingConnectCoordinatorData(parameters=parameters_out)
+            result = await self.write_queue.async_write(idx, parameter, value)
+            written = True
         except AuthenticationError as e:
-            raise ConfigEntryAuthFailed from e
-        except NetworkError as e:
-            raise UpdateFailed(repr(e)) from e
+            self.metrics.record_error(repr(e), dt_util.utcnow())
+            self.config_entry.async_start_reauth(self.hass)
+            raise HomeAssistantError(
+                f"Could not set {parameter.display_name}: {e!r}"
+            ) from e
+        except OUTAGE_ERRORS as e:
+            self.metrics.record_error(repr(e), dt_util.utcnow())
+            raise HomeAssistantError(
+                f"Could not set {parameter.display_name}: {e!r}"
+            ) from e
+        finally:
+            self._writes_in_flight[idx] -= 1
+            if not self._writes_in_flight[idx]:
+                del self._writes_in_flight[idx]
+            if written:
+                # Without confirm the caller schedules the confirmation
+                if confirm:
+                    self._schedule_confirmation({(idx[0], idx[1])})
+            elif not self._writes_in_flight.get(idx):
+                self.pending_writes.pop(idx, None)
+                self._async_publish_pending({idx})
+        return result
+
+    async def async_set_parameters(
+        self, writes: Sequence[tuple[tuple[int, str, str], str]]
+    ) -> list[Any]:
+        """Write several parameters and return the result or error of each.
+
+        The writes are queued together, so the write queue sends them in one
+        batch per component. The written components are confirmed together
+        once all writes are done, with a single refresh.
+        """
+        results = await asyncio.gather(
+            *(self.async_set_parameter(idx, value, False) for idx, value in writes),
+            return_exceptions=True,
+        )
+        if written := {
+            (idx[0], idx[1])
+            for (idx, _value), result in zip(writes, results, strict=True)
+            if not isinstance(result, BaseException)
+        }:
+            self._schedule_confirmation(written)
+        return results
+
+    @callback
+    def _async_publish_pending(self, changed: set[tuple[int, str, str]]) -> None:
+        """Show the current pending state of the given parameters."""
+        slots = set()
+        for idx in changed:
+            if (slot := self.store.get_slot(idx)) is None:
+                continue
+            if (value := self.pending_writes.get(idx)) is None:
+                parameter = self.components[idx[0]][idx[1]].parameters.get(idx[2])
+                value = None if parameter is None else parameter.value
+            self.store.values[slot] = value
+            slots.add(slot)
+        self.data = replace(self.data, changed=slots)
+        self.async_update_listeners()
+
+    def _schedule_confirmation(self, keys: set[tuple[int, str]]) -> None:
+        """Poll the components after a delay to confirm the written values.
+
+        The components share one timer, so they are polled by one refresh.
+        """
+        for key in keys:
+            self._cancel_confirmation(key)
+        cancel = async_call_later(
+            self.hass, WRITE_CONFIRM_DELAY, partial(self._handle_confirm_due, keys)
+        )
+        for key in keys:
+            self._confirm_timers[key] = (cancel, keys)
+
+    def _cancel_confirmation(self, key: tuple[int, str]) -> None:
+        """Take a component out of the timer that would confirm it."""
+        if (timer := self._confirm_timers.pop(key, None)) is None:
+            return
+        cancel, keys = timer
+        keys.discard(key)
+        if not keys:
+            cancel()
+
+    @callback
+    def _handle_confirm_due(self, keys: set[tuple[int, str]], _now: datetime) -> None:
+        """Poll the components whose parameters were written."""
+        for key in keys:
+            self._confirm_timers.pop(key, None)
+            self._confirming.add(key)
+            self.scheduler.request_poll(key)
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_refresh(),
+            f"{DOMAIN} {self.name} confirm write",
+        )
+
+    def _resolve_pending_writes(
+        self, polled: set[tuple[int, str]]
+    ) -> set[tuple[int, str, str]]:
+        """Confirm or roll back the pending writes of the polled components.
+
+        Must be called with the polled values in the store. Returns the
+        parameters that are no longer pending.
+        """
+        resolved = set()
+        for idx, value in list(self.pending_writes.items()):
+            key = (idx[0], idx[1])
+            if key not in polled or self._writes_in_flight.get(idx):
+                continue
+            slot = self.store.get_slot(idx)
+            polled_value = None if slot is None else self.store.values[slot]
+            if slot is not None and _values_match(polled_value, value):
+                LOGGER.debug("Confirmed value %s of %s", value, idx)
+            elif key in self._confirming:
+                LOGGER.warning(
+                    "Parameter %s was not set to %s, it is %s",
+                    idx,
+                    value,
+                    polled_value,
+                )
+            else:
+                continue
+            del self.pending_writes[idx]
+            resolved.add(idx)
+        self._confirming -= polled
+        return resolved
+
+    async def async_shutdown(self) -> None:
+        """Send the queued writes and release the account before shutting down."""
+        await super().async_shutdown()
+        for cancel, _keys in self._confirm_timers.values():
+            cancel()
+        self._confirm_timers.clear()
+        await self.write_queue.async_shutdown()
+        self._remove_request_listener()
+        self._remove_token_listener()
+        async_release_account(self.hass, self.account, self.config_entry.entry_id)
 
-    def _register_facility_device_info(self, facility: Facility) -> None:
+    def _get_poll_interval(self, component: Component) -> timedelta:
+        """Return how often the component has to be polled.
+
+        Unless configured otherwise, components that only have settings and
+        hour counters are polled at the slow interval.
+        """
+        key = (component.facility_id, component.component_id)
+        if self._configured_slow_components is not None:
+            slow = f"{key[0]}_{key[1]}" in self._configured_slow_components
+        else:
+            slow = not any(
+                not parameter.editable and parameter.unit != "h"
+                for parameter in component.parameters.values()
+            )
+        if slow:
+            self._slow_components.add(key)
+            return self.slow_interval
+        self._slow_components.discard(key)
+        return self.facility_poll_interval(component.facility_id)
+
+    def facility_poll_interval(self, facility_id: int) -> timedelta:
+        """Return the poll interval of the facility's fast components."""
+        if self.push is not None and self.push.live:
+            return self.slow_interval
+        tracker = self.activity.get(facility_id)
+        if tracker is None or tracker.active is None:
+            return self.fast_interval
+        return self.active_interval if tracker.active else self.idle_interval
+
+    def _update_activity(self, facility_id: int) -> None:
+        """Adapt the poll interval of a facility to whether it is firing."""
+        tracker = self.activity.setdefault(
+            facility_id, ActivityTracker(ACTIVITY_IDLE_AFTER)
+        )
+        facility_components = self.components[facility_id]
+        if not tracker.update(
+            is_active(
+                parameter
+                for component in facility_components.values()
+                for parameter in component.parameters.values()
+            )
+        ):
+            return
+
+        interval = self.facility_poll_interval(facility_id)
+        LOGGER.debug(
+            "Facility %s is %s, polling every %s",
+            facility_id,
+            {True: "active", False: "idle", None: "unknown"}[tracker.active],
+            interval,
+        )
+        for cid in facility_components:
+            key = (facility_id, cid)
+            if key in self.scheduler and key not in self._slow_components:
+                self.scheduler.set_interval(key, interval)
+
+    @property
+    def slow_components(self) -> list[str]:
+        """Return the components that are polled at the slow interval."""
+        return [f"{fid}_{cid}" for fid, cid in self._slow_components]
+
+    async def _async_update_component(
+        self, component: Component, durations: dict[str, float]
+    ) -> dict[str, Parameter]:
+        """Fetch the parameters of a single component within the request budget.
+
+        The duration of a successful request is added to durations.
+        """
+
+        async def update() -> dict[str, Parameter]:
+            LOGGER.debug("Pulling %s", component.display_name)
+            start = time.monotonic()
+            parameters = await component.update()
+            if not component.raw.get("timeWindowsView"):
+                # The library keeps the last time windows if there are none
+                component.time_windows_view = None
+            durations[f"{component.facility_id}_{component.component_id}"] = (
+                time.monotonic() - start
+            )
+            return parameters
+
+        return await self._async_request(update)
+
+    async def _async_request[T](self, request: Callable[[], Awaitable[T]]) -> T:
+        """Make a request within the request budget.
+
+        If the cloud rejects the token, log in again and retry the request
+        once before the AuthenticationError is raised.
+        """
+        token = self.account.token
+        try:
+            return await self._async_guarded_request(request)
+        except AuthenticationError:
+            await self.account.async_relogin(token)
+        self.metrics.record_retry()
+        return await self._async_guarded_request(request)
+
+    async def _async_guarded_request[T](self, request: Callable[[], Awaitable[T]]) -> T:
+        """Make a request unless the circuit breaker of the account is open."""
+        breaker = self.account.breaker
+        await breaker.async_before_request()
+        try:
+            async with self.rate_limiter, asyncio.timeout(self.request_timeout):
+                result = await request()
+        except Exception as e:
+            if is_outage(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            breaker.record_aborted()
+            raise
+        breaker.record_success()
+        return result
+
+    @callback
+    def _handle_new_token(self, token: str) -> None:
+        """Save a new token of the account to the config entry."""
+        if self.config_entry.data.get(CONF_TOKEN) != token:
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data={**self.config_entry.data, CONF_TOKEN: token}
+            )
+
+    def _register_facility_device_info(self, facility: dict[str, Any]) -> None:
         device_registry = dr.async_get(self.hass)
 
         device_registry.async_get_or_create(
             config_entry_id=self.config_entry.entry_id,
-            identifiers={(DOMAIN, "facility", facility.facility_id)},
-            name=facility.name,
+            identifiers={(DOMAIN, "facility", facility["facility_id"])},
+            name=facility["name"],
             manufacturer="Fröling",
-            model=f"{facility.name} {facility.facility_generation}",
+            model=f"{facility['name']} {facility['facility_generation']}",
             # model_id=facility.facility_id, # Only sometimes breaks?
-            serial_number=str(facility.equipment_number),
+            serial_number=str(facility["equipment_number"]),
+        )
+
+    @property
+    def account_device_info(self) -> DeviceInfo:
+        """Return the service device of the diagnostic entities of the entry."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, "account", self.config_entry.entry_id)},
+            entry_type=dr.DeviceEntryType.SERVICE,
+            name=self.config_entry.title,
+            manufacturer="Fröling",
         )
 
     def _get_component_device_info(self, component: Component) -> DeviceInfo:
@@ -128,68 +1060,3 @@ class FroelingConnectDataUpdateCoordinator(
             serial_number=component.component_id,
             via_device=(DOMAIN, "facility", component.facility_id),
         )
-
-    def _check_unregistered_parameters(self) -> None:
-        """Detect and log parameters not covered by this component."""
-
-        def filter_sensor(param: Parameter) -> bool:
-            if (
-                param.parameter_type not in ("NumValueObject", "StringValueObject")
-                or param.editable
-            ):
-                return False
-            if param.min_val == "0" and param.max_val == "1" and param.unit == "":
-                return False
-            return True
-
-        def filter_binary_sensor(param: Parameter) -> bool:
-            if param.parameter_type != "NumValueObject" or param.editable:
-                return False
-            if param.min_val == "0" and param.max_val == "1" and param.unit == "":
-                return True
-            return False
-
-        def filter_number(param: Parameter) -> bool:
-            if param.parameter_type != "NumValueObject" or not param.editable:
-                return False
-            if param.min_val == "0" and param.max_val == "1" and param.unit == "":
-                return False
-            return True
-
-        def filter_select(param: Parameter) -> bool:
-            if (
-                param.parameter_type != "StringValueObject"
-                or not param.editable
-                or not param.string_list_key_values
-            ):
-                return False
-            return True
-
-        for (_, cid, _), p in self.data.parameters.items():
-            sensor = filter_sensor(p)
-            binary_sensor = filter_binary_sensor(p)
-            number = filter_number(p)
-            select = filter_select(p)
-            count = sum((sensor, binary_sensor, number, select))
-            if count == 0:
-                lvl = logging.DEBUG
-                msg = "Parameter %s.%s.%s[%s] not registered. type: %s, editable: %s, min: %s, max: %s, unit: %s, slkv: %s"
-            elif count > 1:
-                lvl = logging.WARNING
-                msg = f"Parameter %s.%s.%s[%s] registered multiple times {(sensor, binary_sensor, number, select)}. type: %s, editable: %s, min: %s, max: %s, unit: %s, slkv: %s"
-            else:
-                continue
-            LOGGER.log(
-                lvl,
-                msg,
-                p.facility_id,
-                cid,
-                p.id,
-                p.name,
-                p.parameter_type,
-                p.editable,
-                p.min_val,
-                p.max_val,
-                p.unit,
-                bool(p.string_list_key_values),
-            )
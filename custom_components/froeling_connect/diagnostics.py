@@ -0,0 +1,69 @@
+"""Diagnostics support for Froeling Connect."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PUSH_URL
+from .coordinator import FroelingConnectConfigEntry
+
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_PUSH_URL,
+    "equipment_number",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: FroelingConnectConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+
+    return async_redact_data(
+        {
+            "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+            "facilities": coordinator.facilities,
+            "components": {
+                f"{fid}_{cid}": {
+                    **asdict(status),
+                    "poll_interval": coordinator.scheduler.interval(
+                        (fid, cid)
+                    ).total_seconds()
+                    if (fid, cid) in coordinator.scheduler
+                    else None,
+                }
+                for (fid, cid), status in coordinator.data.components.items()
+            },
+            "slow_components": coordinator.slow_components,
+            "parameters": len(coordinator.store),
+            "request_timeout": coordinator.request_timeout,
+            "connection": {
+                **coordinator.account.connection.as_dict(),
+                **coordinator.account.connection_stats.as_dict(),
+            },
+            "circuit_breaker": {
+                "state": coordinator.account.breaker.state,
+                "failures": coordinator.account.breaker.failures,
+                "retry_at": coordinator.account.breaker.retry_at,
+            },
+            "push": None
+            if (push := coordinator.push) is None
+            else {
+                "connected": push.connected,
+                "live": push.live,
+                "connections": push.connections,
+                "messages": push.messages,
+            },
+            "errors": list(coordinator.errors.active.values()),
+            "metrics": coordinator.metrics.as_dict(),
+        },
+        TO_REDACT,
+    )
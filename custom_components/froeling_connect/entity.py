@@ -0,0 +1,142 @@
+"""Base entity for the Fröling Connect integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import generate_entity_id
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .classification import is_low_value
+from .const import ATTRIBUTION, SIGNAL_PARAMETERS_CHANGED
+from .coordinator import FroelingConnectDataUpdateCoordinator
+
+
+class FroelingConnectEntity(CoordinatorEntity[FroelingConnectDataUpdateCoordinator]):
+    """Representation of a single parameter of a Fröling component."""
+
+    _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: FroelingConnectDataUpdateCoordinator,
+        idx: tuple[int, str, str],
+        entity_id_format: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, context=idx)
+
+        self._idx = idx  # (facility_id, component_id, parameter_id)
+        self._slot = coordinator.store.slot(idx)
+
+        info = coordinator.store.info[self._slot]
+        assert info is not None
+        self.info = info
+
+        self._attr_name = info.display_name
+        self._attr_entity_registry_enabled_default = not is_low_value(info)
+        self._attr_unique_id = f"{idx[0]}_{idx[1]}_{idx[2]}"
+        component_name = coordinator.components[idx[0]][idx[1]].display_name
+        self.entity_id = generate_entity_id(
+            entity_id_format,
+            f"{idx[0]}_{component_name}_{info.name}",
+            hass=coordinator.hass,
+        )
+
+        self._attr_device_info = coordinator.component_device_info[(idx[0], idx[1])]
+        self._written_available: bool | None = None
+
+    @property
+    def value(self) -> str | None:
+        """Return the current value of the parameter."""
+        return self.coordinator.store.values[self._slot]
+
+    @property
+    def available(self) -> bool:
+        """Return if the data of this parameter's component is up to date."""
+        status = self.coordinator.data.components.get((self._idx[0], self._idx[1]))
+        return (
+            super().available
+            and status is not None
+            and not status.stale
+            and self._idx in self.coordinator.store
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return if a written value still has to be confirmed by a poll."""
+        if self._idx in self.coordinator.pending_writes:
+            return {"pending": True}
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the availability written when the entity was added."""
+        await super().async_added_to_hass()
+        self._written_available = self.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        The state is only written if the value or the availability changed.
+        """
+        available = self.available
+        if (
+            self._slot not in self.coordinator.data.changed
+            and available is self._written_available
+        ):
+            return
+        self._written_available = available
+        self._update_from_parameter()
+        self.async_write_ha_state()
+
+    def _update_from_parameter(self) -> None:
+        """Update the entity attributes from self.value."""
+
+
+@callback
+def async_add_parameter_entities(
+    coordinator: FroelingConnectDataUpdateCoordinator,
+    platform: Platform,
+    async_add_entities: AddEntitiesCallback,
+    entity_factory: Callable[[tuple[int, str, str]], FroelingConnectEntity],
+) -> None:
+    """Add an entity for every parameter of a platform and keep them in sync.
+
+    Entities of parameters that appear later are added and those of
+    parameters that disappear are removed, their registry entries are kept
+    in case the parameter comes back.
+    """
+    entities: dict[tuple[int, str, str], FroelingConnectEntity] = {}
+
+    @callback
+    def async_parameters_changed(
+        added: list[tuple[int, str, str]], removed: set[tuple[int, str, str]]
+    ) -> None:
+        for idx in removed:
+            if (entity := entities.pop(idx, None)) is not None:
+                coordinator.hass.async_create_task(entity.async_remove())
+        new_entities = [
+            entities.setdefault(idx, entity_factory(idx))
+            for idx in added
+            if idx not in entities
+        ]
+        if new_entities:
+            async_add_entities(new_entities)
+
+    async_parameters_changed(coordinator.platform_index[platform], set())
+    coordinator.config_entry.async_on_unload(
+        async_dispatcher_connect(
+            coordinator.hass,
+            SIGNAL_PARAMETERS_CHANGED.format(
+                coordinator.config_entry.entry_id, platform
+            ),
+            async_parameters_changed,
+        )
+    )
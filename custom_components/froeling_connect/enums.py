@@ -0,0 +1,40 @@
+"""Lookup tables for parameters with enumerated values."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from froeling import Parameter
+
+
+@dataclass(frozen=True, slots=True)
+class EnumMap:
+    """Map the raw values of a parameter to their labels and back."""
+
+    labels: dict[str, str]  # value -> label
+    values: dict[str, str]  # label -> value
+
+    @classmethod
+    def from_parameter(cls, parameter: Parameter) -> EnumMap | None:
+        """Build the map of a parameter, None if it has no enumerated values."""
+        if not parameter.string_list_key_values:
+            return None
+        labels = {
+            str(value): label
+            for value, label in parameter.string_list_key_values.items()
+        }
+        values: dict[str, str] = {}
+        for value, label in labels.items():
+            # The first value wins if several share a label
+            values.setdefault(label, value)
+        return cls(labels, values)
+
+    @property
+    def options(self) -> list[str]:
+        """Return the labels in the order of the values."""
+        return list(self.labels.values())
+
+    def label(self, value: str | None) -> str:
+        """Return the label of a raw value, the value itself if it is unknown."""
+        value = str(value)
+        return self.labels.get(value, value)
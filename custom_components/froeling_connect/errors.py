@@ -0,0 +1,144 @@
+"""Errors and alarms of the facilities of a Froeling Connect account."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from froeling.datamodels import NotificationOverview
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+
+from .const import DOMAIN, EVENT_ERROR, LOGGER
+
+# Notification types that are errors, with the severity of their repair issue
+ERROR_SEVERITIES: dict[str, ir.IssueSeverity] = {
+    "ALARM": ir.IssueSeverity.CRITICAL,
+    "ERROR": ir.IssueSeverity.ERROR,
+    "WARNING": ir.IssueSeverity.WARNING,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FacilityError:
+    """An unread error notification of a facility."""
+
+    key: str  # "<facility_id>_<error_id>_<timestamp>"
+    notification_id: int | None
+    facility_id: int
+    facility_name: str | None
+    error_id: int | None
+    type: str
+    subject: str | None
+    date: str | None
+
+    @classmethod
+    def from_notification(cls, notification: NotificationOverview) -> FacilityError:
+        """Take the error of a notification."""
+        assert notification.facility_id is not None
+        assert notification.type is not None
+        timestamp = (
+            int(notification.date.timestamp()) if notification.date is not None else 0
+        )
+        error_id = (
+            notification.error_id
+            if notification.error_id is not None
+            else notification.id
+        )
+        return cls(
+            key=f"{notification.facility_id}_{error_id}_{timestamp}",
+            notification_id=notification.id,
+            facility_id=notification.facility_id,
+            facility_name=notification.facility_name,
+            error_id=notification.error_id,
+            type=notification.type,
+            subject=notification.subject,
+            date=None if notification.date is None else notification.date.isoformat(),
+        )
+
+
+class ErrorMonitor:
+    """Fire events and keep repair issues for the errors of the facilities.
+
+    An error is active from the time its notification shows up unread until
+    it is read or deleted in the app. Only errors that appear or clear
+    trigger an event, keyed by the facility, the error id and the time of
+    the error, so repeated notifications of the same occurrence count once.
+    The notifications are fetched for the whole account, see
+    FroelingAccount.async_get_notifications, each monitor only reports the
+    errors of the facilities of its config entry.
+    The repair issues of the active errors survive restarts and seed the
+    index, so a restart does not report them again.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the monitor with the errors known from repair issues."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self._issue_prefix = f"error_{entry_id}_"
+        self.active: dict[str, dict[str, Any]] = {
+            issue.issue_id.removeprefix(self._issue_prefix): issue.data or {}
+            for issue in ir.async_get(hass).issues.values()
+            if issue.domain == DOMAIN
+            and issue.active
+            and issue.issue_id.startswith(self._issue_prefix)
+        }
+
+    @callback
+    def async_update(
+        self,
+        notifications: list[NotificationOverview],
+        facility_ids: Collection[int],
+    ) -> None:
+        """Report the changes of the unread errors of the facilities."""
+        current: dict[str, FacilityError] = {}
+        for notification in notifications:
+            if (
+                notification.unread
+                and notification.type in ERROR_SEVERITIES
+                and notification.facility_id in facility_ids
+            ):
+                error = FacilityError.from_notification(notification)
+                current.setdefault(error.key, error)
+
+        for key in self.active.keys() - current.keys():
+            data = self.active.pop(key)
+            LOGGER.info("Error cleared: %s", data.get("subject"))
+            ir.async_delete_issue(self.hass, DOMAIN, self._issue_prefix + key)
+            self._fire(data, "cleared")
+
+        for key in current.keys() - self.active.keys():
+            error = current[key]
+            data = self.active[key] = asdict(error)
+            LOGGER.warning(
+                "%s of %s: %s", error.type, error.facility_name, error.subject
+            )
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                self._issue_prefix + key,
+                is_fixable=False,
+                is_persistent=True,
+                severity=ERROR_SEVERITIES[error.type],
+                translation_key="facility_error",
+                translation_placeholders={
+                    "facility": error.facility_name or str(error.facility_id),
+                    "subject": error.subject or error.type,
+                    "date": error.date or "",
+                },
+                data=data,
+            )
+            self._fire(data, "new")
+
+    @callback
+    def async_remove_issues(self) -> None:
+        """Remove the repair issues of the config entry."""
+        for key in self.active:
+            ir.async_delete_issue(self.hass, DOMAIN, self._issue_prefix + key)
+
+    def _fire(self, data: dict[str, Any], state: str) -> None:
+        self.hass.bus.async_fire(
+            EVENT_ERROR, {**data, "config_entry_id": self.entry_id, "state": state}
+        )
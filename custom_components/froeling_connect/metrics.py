@@ -0,0 +1,101 @@
+"""Measurements of the refreshes of the Froeling Connect coordinator."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import math
+import time
+from typing import Any
+
+# Refreshes kept for the percentiles and the diagnostics
+CYCLE_HISTORY = 100
+# Request timestamps kept for the requests per hour
+REQUEST_HISTORY = 10_000
+_HOUR = 3600.0
+
+
+@dataclass(frozen=True, slots=True)
+class CycleRecord:
+    """Measurements of a single refresh."""
+
+    start: datetime
+    duration: float  # seconds
+    polled: int
+    errors: int
+    changed: int
+    # Request duration in seconds per polled "<facility_id>_<component_id>"
+    component_durations: dict[str, float]
+
+
+class PollMetrics:
+    """Bounded history of refreshes and API requests."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.cycles: deque[CycleRecord] = deque(maxlen=CYCLE_HISTORY)
+        self._requests: deque[float] = deque(maxlen=REQUEST_HISTORY)
+        self.total_requests = 0
+        self.total_errors = 0
+        self.total_retries = 0
+        self.last_error: str | None = None
+        self.last_error_time: datetime | None = None
+        # Latest request duration per "<facility_id>_<component_id>"
+        self.component_durations: dict[str, float] = {}
+
+    def record_request(self) -> None:
+        """Count an API request."""
+        self._requests.append(time.monotonic())
+        self.total_requests += 1
+
+    def record_retry(self) -> None:
+        """Count a request that was repeated after logging in again."""
+        self.total_retries += 1
+
+    def record_error(self, error: str, when: datetime) -> None:
+        """Remember a failed request."""
+        self.total_errors += 1
+        self.last_error = error
+        self.last_error_time = when
+
+    def record_cycle(self, record: CycleRecord) -> None:
+        """Add a refresh to the history."""
+        self.cycles.append(record)
+        self.component_durations.update(record.component_durations)
+
+    def requests_last_hour(self) -> int:
+        """Return the number of API requests in the last hour."""
+        since = time.monotonic() - _HOUR
+        while self._requests and self._requests[0] < since:
+            self._requests.popleft()
+        return len(self._requests)
+
+    def cycle_duration(self, percentile: float) -> float | None:
+        """Return a percentile (0-100) of the recent refresh durations."""
+        if not self.cycles:
+            return None
+        durations = sorted(cycle.duration for cycle in self.cycles)
+        rank = max(math.ceil(percentile / 100 * len(durations)) - 1, 0)
+        return durations[rank]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for the diagnostics."""
+        return {
+            "total_requests": self.total_requests,
+            "requests_last_hour": self.requests_last_hour(),
+            "total_errors": self.total_errors,
+            "total_retries": self.total_retries,
+            "last_error": self.last_error,
+            "last_error_time": self.last_error_time,
+            "cycle_duration_p50": self.cycle_duration(50),
+            "cycle_duration_p95": self.cycle_duration(95),
+            "component_durations": dict(
+                sorted(
+                    self.component_durations.items(),
+                    key=lambda item: item[1],
+                    reverse=True,
+                )
+            ),
+            "cycles": [asdict(cycle) for cycle in self.cycles],
+        }
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from homeassistant.components.number import NumberDeviceClass, NumberEntity
-from homeassistant.const import UnitOfTemperature, UnitOfTime
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import generate_entity_id
+from homeassistant.components.number import (
+    ENTITY_ID_FORMAT,
+    NumberDeviceClass,
+    NumberEntity,
+)
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, CONF_SEND_CHANGES, LOGGER
+from .const import CONF_SEND_CHANGES, LOGGER, NUMBER_STEP
 from .coordinator import (
     FroelingConnectConfigEntry,
     FroelingConnectDataUpdateCoordinator,
 )
+from .entity import FroelingConnectEntity, async_add_parameter_entities
 
 device_class_unit_mapping: dict[str, str] = {
     "°C": (NumberDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
@@ -31,28 +34,18 @@ async def async_setup_entry(
     """Add Froeling Connect entities from a config_entry."""
     coordinator = entry.runtime_data
 
-    entities = []
-    for idx, param in coordinator.data.parameters.items():
-        if not param.editable or not entry.data[CONF_SEND_CHANGES]:
-            continue  # Use sensor instead
-        if param.parameter_type != "NumValueObject":
-            continue  # Can't be represented by number
-        if param.min_val == "0" and param.max_val == "1" and param.unit == "":
-            continue  # Use switch instead
-        entities.append(
-            FroelingConnectNumber(coordinator, idx, entry.data[CONF_SEND_CHANGES])
-        )
-
-    async_add_entities(entities)
+    async_add_parameter_entities(
+        coordinator,
+        Platform.NUMBER,
+        async_add_entities,
+        lambda idx: FroelingConnectNumber(
+            coordinator, idx, entry.data[CONF_SEND_CHANGES]
+        ),
+    )
 
 
-class FroelingConnectNumber(
-    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], NumberEntity
-):
-    """Representation of a Sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
+class FroelingConnectNumber(FroelingConnectEntity, NumberEntity):
+    """Representation of a Number."""
 
     def __init__(
         self,
@@ -61,49 +54,27 @@ class FroelingConnectNumber(
         send_changes: bool = True,
     ) -> None:
         """Initialize number platform for Froeling Connect integration."""
-        super().__init__(coordinator, context=idx)
+        super().__init__(coordinator, idx, ENTITY_ID_FORMAT)
 
-        self._idx = idx  # (facility_id, component_id, parameter_id)
         self.send_changes = send_changes
 
-        parameter = coordinator.data.parameters[idx]
-        component = coordinator.components[idx[0]][idx[1]]
-        self.parameter = parameter
-        self.component = component
-
-        self._attr_name = parameter.display_name
-        self._attr_unique_id = f"{idx[0]}_{idx[1]}_{idx[2]}"
-        self.entity_id = generate_entity_id(
-            "number.{}",
-            f"{idx[0]}_{component.display_name}_{parameter.name}",
-            hass=coordinator.hass,
-        )
-
-        if parameter.unit in device_class_unit_mapping:
-            cls, unit = device_class_unit_mapping[parameter.unit]
+        info = self.info
+
+        if info.unit in device_class_unit_mapping:
+            cls, unit = device_class_unit_mapping[info.unit]
             self._attr_device_class = cls
             self._attr_native_unit_of_measurement = unit
-        elif parameter.unit:
-            self._attr_native_unit_of_measurement = parameter.unit
+        elif info.unit:
+            self._attr_native_unit_of_measurement = info.unit
 
-        self._attr_native_max_value = float(parameter.max_val)
-        self._attr_native_min_value = float(parameter.min_val)
-        self._attr_native_step = 1
+        self._attr_native_max_value = float(info.max_val)
+        self._attr_native_min_value = float(info.min_val)
+        self._attr_native_step = NUMBER_STEP
 
-        self._attr_device_info = self.coordinator.component_device_info[
-            (self._idx[0], self._idx[1])
-        ]
+        self._update_from_parameter()
 
-        self._attr_native_value = parameter.value
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        parameter = self.coordinator.data.parameters[self._idx]
-        self._attr_native_value = parameter.value
-        self.parameter = parameter
-
-        self.async_write_ha_state()
+    def _update_from_parameter(self) -> None:
+        self._attr_native_value = self.value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -112,4 +83,9 @@ class FroelingConnectNumber(
             return
 
         LOGGER.debug("New value for %s is %f", self.name, value)
-        await self.parameter.set_value(str(int(value)))
+        await self.coordinator.async_set_parameter(self._idx, format_number(value))
+
+
+def format_number(value: float) -> str:
+    """Format the value of a number the way the cloud expects it."""
+    return str(int(value))
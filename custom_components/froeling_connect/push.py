@@ -0,0 +1,123 @@
+"""Optional push channel for parameter changes of Froeling Connect."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import json
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientWebSocketResponse, WSMsgType
+
+from .const import (
+    LOGGER,
+    PUSH_HEARTBEAT,
+    PUSH_MAX_RECONNECT_DELAY,
+    PUSH_QUIET_AFTER,
+    PUSH_RECONNECT_DELAY,
+)
+
+_CLOSED = (WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED, WSMsgType.ERROR)
+
+
+def parse_message(
+    data: str,
+) -> tuple[tuple[int, str], dict[str, str | None]] | None:
+    """Return the component and the new parameter values of a push message.
+
+    Returns None for messages without changes, like keepalives.
+    """
+    try:
+        message: Any = json.loads(data)
+        key = (int(message["facilityId"]), str(message["componentId"]))
+        values = {
+            str(parameter["id"]): (
+                None if parameter.get("value") is None else str(parameter["value"])
+            )
+            for parameter in message["parameters"]
+        }
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+    return key, values
+
+
+class PushListener:
+    """Receive parameter changes from a websocket.
+
+    The Froeling Connect cloud itself can only be polled. If an event
+    source is configured, for example a bridge forwarding the changes the
+    app receives, every text message is expected to look like
+
+        {"facilityId": 1, "componentId": "1_100",
+         "parameters": [{"id": "7_0", "value": "61"}]}
+
+    Other messages, like keepalives, only show that the channel works. The
+    channel is live while messages arrive at least every PUSH_QUIET_AFTER
+    seconds, on_live is called whenever that changes. A closed connection is
+    reopened with an increasing delay.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        url: str,
+        on_change: Callable[[tuple[int, str], dict[str, str | None]], None],
+        on_live: Callable[[bool], None],
+    ) -> None:
+        """Initialize the listener, async_run connects."""
+        self._session = session
+        self.url = url
+        self._on_change = on_change
+        self._on_live = on_live
+        self.connected = False
+        self.live = False
+        self.messages = 0
+        self.connections = 0
+
+    async def async_run(self) -> None:
+        """Listen until cancelled."""
+        delay = PUSH_RECONNECT_DELAY
+        while True:
+            try:
+                async with self._session.ws_connect(
+                    self.url, heartbeat=PUSH_HEARTBEAT
+                ) as ws:
+                    LOGGER.debug("Connected to the push channel")
+                    self.connected = True
+                    self.connections += 1
+                    delay = PUSH_RECONNECT_DELAY
+                    await self._async_receive(ws)
+            except (ClientError, TimeoutError) as e:
+                LOGGER.debug("Push channel failed: %r", e)
+            finally:
+                self.connected = False
+            # Not reached when cancelled, the coordinator is being unloaded then
+            self._set_live(False)
+            LOGGER.debug("Reconnecting to the push channel in %s s", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PUSH_MAX_RECONNECT_DELAY)
+
+    async def _async_receive(self, ws: ClientWebSocketResponse) -> None:
+        """Handle the messages of a connection until it closes."""
+        while True:
+            try:
+                message = await ws.receive(timeout=PUSH_QUIET_AFTER)
+            except TimeoutError:
+                # Keep the connection, polling takes over until it speaks again
+                self._set_live(False)
+                continue
+            if message.type in _CLOSED:
+                return
+            if message.type is not WSMsgType.TEXT:
+                continue
+            self.messages += 1
+            self._set_live(True)
+            if (change := parse_message(message.data)) is not None:
+                self._on_change(*change)
+
+    def _set_live(self, live: bool) -> None:
+        if live is self.live:
+            return
+        self.live = live
+        LOGGER.info("Push channel is %s", "live" if live else "quiet, polling")
+        self._on_live(live)
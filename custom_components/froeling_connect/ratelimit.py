@@ -0,0 +1,76 @@
+"""Request budget for the Froeling Connect API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import time
+from types import TracebackType
+
+
+class RequestRateLimiter:
+    """Token bucket combined with a limit on concurrent requests.
+
+    Every API request has to be made inside ``async with limiter:``. A request
+    may start once a slot is free (at most ``max_in_flight`` at a time) and a
+    token is available. Tokens refill at ``rate`` per second, up to ``burst``.
+    ``on_request`` is called for every request that is let through.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_in_flight: int,
+        on_request: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the rate limiter."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._on_request = on_request
+
+    async def acquire(self) -> None:
+        """Wait for a free request slot and a token."""
+        await self._semaphore.acquire()
+        try:
+            await self._take_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        if self._on_request is not None:
+            self._on_request()
+
+    def release(self) -> None:
+        """Free the request slot."""
+        self._semaphore.release()
+
+    async def _take_token(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in FIFO order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    async def __aenter__(self) -> None:
+        """Acquire the limiter."""
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the limiter."""
+        self.release()
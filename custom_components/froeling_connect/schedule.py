@@ -0,0 +1,83 @@
+"""Weekly time windows of Froeling Connect components."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any
+
+_WEEKDAYS = (
+    "MONDAY",
+    "TUESDAY",
+    "WEDNESDAY",
+    "THURSDAY",
+    "FRIDAY",
+    "SATURDAY",
+    "SUNDAY",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TimeWindow:
+    """A phase of a day. If it ends at or before its start, it ends the next day."""
+
+    weekday: int  # 0 is Monday
+    start: time
+    end: time
+
+
+def _time(hour: int, minute: int) -> time:
+    # The cloud ends a phase at midnight with 24:00
+    return time(0) if hour >= 24 else time(hour, minute)
+
+
+class WeeklySchedule:
+    """The time windows of a component, built from the raw cloud payload.
+
+    The raw payload is kept, so that a poll can tell whether the schedule
+    changed by comparing it instead of building the windows again.
+    """
+
+    def __init__(self, raw: Sequence[dict[str, Any]]) -> None:
+        """Build the windows of the raw "timeWindowsView" days."""
+        self.raw = raw
+        windows = []
+        for day in raw:
+            try:
+                weekday = _WEEKDAYS.index(day["weekDay"])
+                windows.extend(
+                    TimeWindow(
+                        weekday,
+                        _time(phase["startHour"], phase["startMinute"]),
+                        _time(phase["endHour"], phase["endMinute"]),
+                    )
+                    for phase in day["phases"]
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        self.windows = tuple(sorted(windows, key=lambda w: (w.weekday, w.start)))
+
+    def events(
+        self, start: datetime, end: datetime, tz: tzinfo
+    ) -> Iterator[tuple[datetime, datetime]]:
+        """Return the windows overlapping start to end, in order."""
+        first = start.astimezone(tz).date() - timedelta(days=1)
+        last = end.astimezone(tz).date()
+        day = first
+        while day <= last:
+            for window in self.windows:
+                if window.weekday != day.weekday():
+                    continue
+                window_start, window_end = self._span(day, window, tz)
+                if window_end > start and window_start < end:
+                    yield window_start, window_end
+            day += timedelta(days=1)
+
+    @staticmethod
+    def _span(day: date, window: TimeWindow, tz: tzinfo) -> tuple[datetime, datetime]:
+        window_start = datetime.combine(day, window.start, tz)
+        window_end = datetime.combine(day, window.end, tz)
+        if window_end <= window_start:
+            window_end += timedelta(days=1)
+        return window_start, window_end
@@ -0,0 +1,72 @@
+"""Per-component polling schedule for the Froeling Connect coordinator."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+# Polls that are due within this margin are made in the current cycle
+# instead of scheduling another cycle right after it.
+_TOLERANCE = timedelta(seconds=1)
+
+
+class PollScheduler:
+    """Keep track of when each component is due to be polled.
+
+    Components are identified by (facility_id, component_id).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty schedule."""
+        self._intervals: dict[tuple[int, str], timedelta] = {}
+        self._last_poll: dict[tuple[int, str], datetime] = {}
+
+    def __contains__(self, key: tuple[int, str]) -> bool:
+        """Return if a poll interval is set for the component."""
+        return key in self._intervals
+
+    def interval(self, key: tuple[int, str]) -> timedelta:
+        """Return the poll interval of the component."""
+        return self._intervals[key]
+
+    def set_interval(self, key: tuple[int, str], interval: timedelta) -> None:
+        """Set the poll interval of the component."""
+        self._intervals[key] = interval
+
+    def remove(self, key: tuple[int, str]) -> None:
+        """Stop scheduling the component."""
+        self._intervals.pop(key, None)
+        self._last_poll.pop(key, None)
+
+    def mark_polled(self, key: tuple[int, str], when: datetime) -> None:
+        """Record that the component has been polled."""
+        self._last_poll[key] = when
+
+    def request_poll(self, key: tuple[int, str]) -> None:
+        """Make the component due right away."""
+        self._last_poll.pop(key, None)
+
+    def next_poll(self, key: tuple[int, str]) -> datetime | None:
+        """Return when the component is due, None if it was never polled."""
+        if key not in self._intervals or (last := self._last_poll.get(key)) is None:
+            return None
+        return last + self._intervals[key]
+
+    def due(self, keys: list[tuple[int, str]], now: datetime) -> list[tuple[int, str]]:
+        """Return the components out of keys that have to be polled now."""
+        return [
+            key
+            for key in keys
+            if (next_poll := self.next_poll(key)) is None
+            or next_poll <= now + _TOLERANCE
+        ]
+
+    def time_until_next_poll(
+        self, keys: list[tuple[int, str]], now: datetime
+    ) -> timedelta | None:
+        """Return the time until the next component out of keys is due."""
+        next_polls = [
+            next_poll for key in keys if (next_poll := self.next_poll(key)) is not None
+        ]
+        if not next_polls:
+            return None
+        return max(min(next_polls) - now, timedelta(0))
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
-from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.select import ENTITY_ID_FORMAT, SelectEntity
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
-from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, CONF_SEND_CHANGES, LOGGER
+from .const import CONF_SEND_CHANGES, LOGGER
 from .coordinator import (
     FroelingConnectConfigEntry,
     FroelingConnectDataUpdateCoordinator,
 )
+from .entity import FroelingConnectEntity, async_add_parameter_entities
 
 
 async def async_setup_entry(
@@ -24,34 +24,18 @@ async def async_setup_entry(
     """Add Froeling Connect entities from a config_entry."""
     coordinator = entry.runtime_data
 
-    entities = []
-    for idx, param in coordinator.data.parameters.items():
-        if param.parameter_type != "StringValueObject":
-            continue  # Use number or sensor instead
-        if not param.editable or not entry.data[CONF_SEND_CHANGES]:
-            continue  # use sensor instead
-        if not param.string_list_key_values:
-            LOGGER.warning(
-                "Unexpected parameter data: %s[%s] value mapping is: %s",
-                param.name,
-                param.id,
-                param.string_list_key_values,
-            )
-            continue  # should not happen, type is StringValueObject but no strings are given
-        entities.append(
-            FroelingConnectNumber(coordinator, idx, entry.data[CONF_SEND_CHANGES])
-        )
-
-    async_add_entities(entities)
-
+    async_add_parameter_entities(
+        coordinator,
+        Platform.SELECT,
+        async_add_entities,
+        lambda idx: FroelingConnectSelect(
+            coordinator, idx, entry.data[CONF_SEND_CHANGES]
+        ),
+    )
 
-class FroelingConnectNumber(
-    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], SelectEntity
-):
-    """Representation of a Sensor."""
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
+class FroelingConnectSelect(FroelingConnectEntity, SelectEntity):
+    """Representation of a Select."""
 
     def __init__(
         self,
@@ -60,45 +44,20 @@ class FroelingConnectNumber(
         send_changes: bool = True,
     ) -> None:
         """Initialize select entity for Froeling Connect integration."""
-        super().__init__(coordinator, context=idx)
+        super().__init__(coordinator, idx, ENTITY_ID_FORMAT)
 
-        self._idx = idx  # (facility_id, component_id, parameter_id)
         self.send_changes = send_changes
 
-        parameter = coordinator.data.parameters[idx]
-        component = coordinator.components[idx[0]][idx[1]]
-        self.parameter = parameter
-        self._attr_name = parameter.display_name
-        self._attr_unique_id = f"{idx[0]}_{idx[1]}_{idx[2]}"
-        self.entity_id = generate_entity_id(
-            "select.{}",
-            f"{idx[0]}_{component.display_name}_{parameter.name}",
-            hass=coordinator.hass,
-        )
-
-        self._attr_device_info = self.coordinator.component_device_info[
-            (self._idx[0], self._idx[1])
-        ]
-
-        self._attr_options = list(parameter.string_list_key_values.values())
-
-        self._set_current_option()
+        enum_map = self.info.enum_map
+        assert enum_map is not None
+        self._enum_map = enum_map
+        self._attr_options = self._enum_map.options
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._set_current_option()
-        self.async_write_ha_state()
+        self._update_from_parameter()
 
-    def _set_current_option(self) -> str:
+    def _update_from_parameter(self) -> None:
         """Set the current string value."""
-        parameter = self.coordinator.data.parameters[self._idx]
-        if str(parameter.value) in parameter.string_list_key_values:
-            self._attr_current_option = parameter.string_list_key_values[
-                str(parameter.value)
-            ]
-        else:
-            self._attr_current_option = str(parameter.value)
+        self._attr_current_option = self._enum_map.label(self.value)
 
     async def async_select_option(self, option: str) -> None:
         """Set new value."""
@@ -106,14 +65,9 @@ class FroelingConnectNumber(
             LOGGER.info("Did not set value for %s", self.name)
             return
 
-        if option not in self.parameter.string_list_key_values.values():
+        if (number_value := self._enum_map.values.get(option)) is None:
             raise ServiceValidationError(
-                f"{option} is not a valid state for {self.parameter.name}"
+                f"{option} is not a valid state for {self.info.name}"
             )
-        number_value = next(
-            key
-            for key, value in self.parameter.string_list_key_values.items()
-            if value == str(option)
-        )
         LOGGER.debug("New value for %s is %s (%s)", self.name, option, number_value)
-        await self.parameter.set_value(str(number_value))
+        await self.coordinator.async_set_parameter(self._idx, number_value)
@@ -2,31 +2,139 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+import time
+from typing import Any
+
 from homeassistant.components.sensor import (
+    ENTITY_ID_FORMAT,
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTemperature, UnitOfTime
+from homeassistant.const import (
+    EntityCategory,
+    Platform,
+    UnitOfMass,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import generate_entity_id
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, CONF_SEND_CHANGES
+from .classification import is_counter, is_temporal
+from .const import ATTRIBUTION, COUNTER_WRITE_INTERVAL, DOMAIN
 from .coordinator import (
     FroelingConnectConfigEntry,
     FroelingConnectDataUpdateCoordinator,
 )
+from .entity import FroelingConnectEntity, async_add_parameter_entities
+from .temporal import as_local, parse_temporal, temporal_kind
 
 device_class_unit_mapping: dict[str, str] = {
     "°C": (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
     "°F": (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.FAHRENHEIT),
     "h": (SensorDeviceClass.DURATION, UnitOfTime.HOURS),
+    "kg": (SensorDeviceClass.WEIGHT, UnitOfMass.KILOGRAMS),
     "": (None, None),
 }
 
 
+def _activity(
+    coordinator: FroelingConnectDataUpdateCoordinator, facility_id: int
+) -> dict[str, Any]:
+    tracker = coordinator.activity.get(facility_id)
+    active = None if tracker is None else tracker.active
+    return {"activity": {True: "active", False: "idle", None: None}[active]}
+
+
+@dataclass(frozen=True, kw_only=True)
+class FroelingConnectFacilitySensorEntityDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor of a facility."""
+
+    value_fn: Callable[[FroelingConnectDataUpdateCoordinator, int], StateType]
+    attr_fn: (
+        Callable[[FroelingConnectDataUpdateCoordinator, int], dict[str, Any]] | None
+    ) = None
+
+
+FACILITY_SENSORS: tuple[FroelingConnectFacilitySensorEntityDescription, ...] = (
+    FroelingConnectFacilitySensorEntityDescription(
+        key="poll_interval",
+        translation_key="poll_interval",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        value_fn=lambda coordinator, facility_id: coordinator.facility_poll_interval(
+            facility_id
+        ).total_seconds(),
+        attr_fn=_activity,
+    ),
+    FroelingConnectFacilitySensorEntityDescription(
+        key="updated_entities",
+        translation_key="updated_entities",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator, facility_id: coordinator.notified_entities[
+            facility_id
+        ],
+    ),
+)
+
+
+def _last_error(coordinator: FroelingConnectDataUpdateCoordinator) -> StateType:
+    error = coordinator.metrics.last_error
+    return None if error is None else error[:255]
+
+
+@dataclass(frozen=True, kw_only=True)
+class FroelingConnectAccountSensorEntityDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor of the account."""
+
+    value_fn: Callable[[FroelingConnectDataUpdateCoordinator], StateType]
+    attr_fn: Callable[[FroelingConnectDataUpdateCoordinator], dict[str, Any]] | None = (
+        None
+    )
+
+
+ACCOUNT_SENSORS: tuple[FroelingConnectAccountSensorEntityDescription, ...] = (
+    FroelingConnectAccountSensorEntityDescription(
+        key="cycle_duration_p50",
+        translation_key="cycle_duration_p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.metrics.cycle_duration(50),
+    ),
+    FroelingConnectAccountSensorEntityDescription(
+        key="cycle_duration_p95",
+        translation_key="cycle_duration_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.metrics.cycle_duration(95),
+    ),
+    FroelingConnectAccountSensorEntityDescription(
+        key="api_calls_per_hour",
+        translation_key="api_calls_per_hour",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.metrics.requests_last_hour(),
+    ),
+    FroelingConnectAccountSensorEntityDescription(
+        key="last_error",
+        translation_key="last_error",
+        value_fn=_last_error,
+        attr_fn=lambda coordinator: {"time": coordinator.metrics.last_error_time},
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: FroelingConnectConfigEntry,
@@ -35,26 +143,33 @@ async def async_setup_entry(
     """Add Froeling Connect entities from a config_entry."""
     coordinator = entry.runtime_data
 
-    entities = []
-    for idx, param in coordinator.data.parameters.items():
-        if param.editable and entry.data[CONF_SEND_CHANGES]:
-            continue  # Use number instead
-        if param.parameter_type not in ("NumValueObject", "StringValueObject"):
-            continue  # Not yet implemented, likely a timestamp
-        if param.min_val == "0" and param.max_val == "1" and param.unit == "":
-            continue  # Use binary_sensor instead
-        entities.append(FroelingConnectSensor(coordinator, idx))
+    async_add_parameter_entities(
+        coordinator,
+        Platform.SENSOR,
+        async_add_entities,
+        lambda idx: FroelingConnectSensor(coordinator, idx),
+    )
+
+    entities: list[SensorEntity] = [
+        FroelingConnectFacilitySensor(coordinator, facility_id, description)
+        for facility_id in coordinator.components
+        for description in FACILITY_SENSORS
+    ]
+    entities.extend(
+        FroelingConnectAccountSensor(coordinator, description)
+        for description in ACCOUNT_SENSORS
+    )
 
     async_add_entities(entities)
 
 
-class FroelingConnectSensor(
-    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], SensorEntity
-):
-    """Representation of a Sensor."""
+class FroelingConnectSensor(FroelingConnectEntity, SensorEntity):
+    """Representation of a Sensor.
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
+    Counters such as operating hours are total increasing, so that the
+    recorder keeps their hourly statistics. Their state is written at most
+    every COUNTER_WRITE_INTERVAL.
+    """
 
     def __init__(
         self,
@@ -62,57 +177,156 @@ class FroelingConnectSensor(
         idx: tuple[int, str, str],
     ) -> None:
         """Initialize temperature sensor for Froeling Connect integration."""
-        super().__init__(coordinator, context=idx)
-
-        self._idx = idx  # (facility_id, component_id, parameter_id)
-
-        parameter = coordinator.data.parameters[idx]
-        component = coordinator.components[idx[0]][idx[1]]
-        self.parameter = parameter
-        self.component = component
+        super().__init__(coordinator, idx, ENTITY_ID_FORMAT)
 
-        self._attr_name = parameter.display_name
-        self._attr_unique_id = f"{idx[0]}_{idx[1]}_{idx[2]}"
-        self.entity_id = generate_entity_id(
-            "sensor.{}",
-            f"{idx[0]}_{component.display_name}_{parameter.name}",
-            hass=coordinator.hass,
-        )
-
-        if parameter.parameter_type == "NumValueObject":
+        info = self.info
+        self._enum_map = info.enum_map
+        if info.parameter_type == "NumValueObject":
             self._attr_suggested_display_precision = 0
-            if parameter.unit in device_class_unit_mapping:
-                cls, unit = device_class_unit_mapping[parameter.unit]
+            if info.unit in device_class_unit_mapping:
+                cls, unit = device_class_unit_mapping[info.unit]
                 self._attr_device_class = cls
                 self._attr_native_unit_of_measurement = unit
-            elif parameter.unit:
-                self._attr_native_unit_of_measurement = parameter.unit
+            elif info.unit:
+                self._attr_native_unit_of_measurement = info.unit
             self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif parameter.parameter_type == "StringValueObject":
+        elif self._enum_map is not None:
             self._attr_device_class = SensorDeviceClass.ENUM
-            self._attr_options = list(parameter.string_list_key_values.values())
+            self._attr_options = self._enum_map.options
+        self._temporal = is_temporal(info)
+        if self._temporal:
+            kind = temporal_kind(info.parameter_type, info.unit)
+            if kind is datetime:
+                self._attr_device_class = SensorDeviceClass.TIMESTAMP
+            elif kind is date:
+                self._attr_device_class = SensorDeviceClass.DATE
 
-        self._attr_device_info = self.coordinator.component_device_info[
-            (self._idx[0], self._idx[1])
-        ]
+        self._counter = is_counter(info)
+        if self._counter:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._written_value = self.value
+        self._next_counter_write = 0.0
 
-        self._set_value()
+        self._update_from_parameter()
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._set_value()
+        """Handle updated data from the coordinator, throttling counters."""
+        if not self._counter:
+            super()._handle_coordinator_update()
+            return
+        available = self.available
+        now = time.monotonic()
+        if available is self._written_available and (
+            self.value == self._written_value or now < self._next_counter_write
+        ):
+            return
+        self._written_available = available
+        self._written_value = self.value
+        self._next_counter_write = now + COUNTER_WRITE_INTERVAL.total_seconds()
+        self._update_from_parameter()
         self.async_write_ha_state()
 
-    def _set_value(self) -> None:
-        parameter = self.coordinator.data.parameters[self._idx]
-
-        if (
-            parameter.string_list_key_values
-            and str(parameter.value) in parameter.string_list_key_values
-        ):
-            self._attr_native_value = parameter.string_list_key_values[
-                str(parameter.value)
-            ]
+    def _update_from_parameter(self) -> None:
+        if self._enum_map is not None:
+            self._attr_native_value = self._enum_map.label(self.value)
+        elif self._temporal:
+            self._attr_native_value = self._temporal_value()
         else:
-            self._attr_native_value = parameter.value
+            self._attr_native_value = self.value
+
+    def _temporal_value(self) -> StateType | date | datetime:
+        """Return the parsed value, parse_temporal caches it per raw value."""
+        parsed = parse_temporal(self.value)
+        if self.device_class == SensorDeviceClass.TIMESTAMP:
+            return as_local(parsed) if isinstance(parsed, datetime) else None
+        if self.device_class == SensorDeviceClass.DATE:
+            if isinstance(parsed, datetime):
+                return parsed.date()
+            return parsed if isinstance(parsed, date) else None
+        if parsed is None:
+            return self.value
+        if isinstance(parsed, date):
+            return parsed.isoformat()
+        return parsed.isoformat(timespec="minutes")
+
+
+class FroelingConnectFacilitySensor(
+    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], SensorEntity
+):
+    """Diagnostic sensor about the polling of a facility."""
+
+    entity_description: FroelingConnectFacilitySensorEntityDescription
+
+    _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: FroelingConnectDataUpdateCoordinator,
+        facility_id: int,
+        description: FroelingConnectFacilitySensorEntityDescription,
+    ) -> None:
+        """Initialize a diagnostic sensor of a facility."""
+        super().__init__(coordinator)
+
+        self.entity_description = description
+        self._facility_id = facility_id
+        self._attr_unique_id = f"{facility_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "facility", facility_id)}
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator, self._facility_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the sensor."""
+        if self.entity_description.attr_fn is None:
+            return None
+        return self.entity_description.attr_fn(self.coordinator, self._facility_id)
+
+
+class FroelingConnectAccountSensor(
+    CoordinatorEntity[FroelingConnectDataUpdateCoordinator], SensorEntity
+):
+    """Diagnostic sensor about the requests of the whole account."""
+
+    entity_description: FroelingConnectAccountSensorEntityDescription
+
+    _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: FroelingConnectDataUpdateCoordinator,
+        description: FroelingConnectAccountSensorEntityDescription,
+    ) -> None:
+        """Initialize a diagnostic sensor of the account."""
+        super().__init__(coordinator)
+
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+        self._attr_device_info = coordinator.account_device_info
+
+    @property
+    def available(self) -> bool:
+        """Return True, the metrics are also valid when a refresh failed."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the sensor."""
+        if self.entity_description.attr_fn is None:
+            return None
+        return self.entity_description.attr_fn(self.coordinator)
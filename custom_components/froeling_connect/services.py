@@ -0,0 +1,201 @@
+"""Services of the Fröling Connect integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_COMPONENT_ID,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_FACILITY_ID,
+    ATTR_PARAMETER_ID,
+    ATTR_PARAMETERS,
+    ATTR_VALUE,
+    CONF_SEND_CHANGES,
+    DOMAIN,
+    LOGGER,
+    NUMBER_STEP,
+    SERVICE_SET_PARAMETERS,
+)
+from .coordinator import (
+    FroelingConnectConfigEntry,
+    FroelingConnectDataUpdateCoordinator,
+)
+from .number import format_number
+from .store import ParameterInfo
+
+_PARAMETER_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FACILITY_ID): vol.Coerce(int),
+        vol.Required(ATTR_COMPONENT_ID): cv.string,
+        vol.Required(ATTR_PARAMETER_ID): cv.string,
+        vol.Required(ATTR_VALUE): vol.Any(vol.Coerce(float), cv.string),
+    }
+)
+
+SET_PARAMETERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PARAMETERS): vol.All(
+            cv.ensure_list, vol.Length(min=1), [_PARAMETER_SCHEMA]
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_set_parameters(call: ServiceCall) -> ServiceResponse:
+        """Write a list of parameters and return the result of each.
+
+        All entries are checked before anything is sent. If one of them is
+        invalid, nothing is written. The cloud takes the values one by one,
+        so a write that fails does not undo the others; the response tells
+        which of them were written.
+        """
+        entries: list[dict[str, Any]] = call.data[ATTR_PARAMETERS]
+        writes: list[
+            tuple[FroelingConnectDataUpdateCoordinator, tuple[int, str, str], str]
+        ] = []
+        for entry in entries:
+            idx = (
+                entry[ATTR_FACILITY_ID],
+                entry[ATTR_COMPONENT_ID],
+                entry[ATTR_PARAMETER_ID],
+            )
+            coordinator = _get_coordinator(
+                hass, call.data.get(ATTR_CONFIG_ENTRY_ID), idx
+            )
+            writes.append((coordinator, idx, _validate(coordinator, idx, entry)))
+
+        # One batch per coordinator, its write queue groups them per component
+        batches: dict[
+            FroelingConnectDataUpdateCoordinator,
+            list[tuple[int, tuple[tuple[int, str, str], str]]],
+        ] = {}
+        for position, (coordinator, idx, value) in enumerate(writes):
+            batches.setdefault(coordinator, []).append((position, (idx, value)))
+
+        results: list[Any] = [None] * len(writes)
+        for coordinator, batch in batches.items():
+            batch.sort(key=lambda item: item[1][0][:2])
+            batch_results = await coordinator.async_set_parameters(
+                [write for _position, write in batch]
+            )
+            for (position, _write), result in zip(batch, batch_results, strict=True):
+                results[position] = result
+
+        response = []
+        for (_coordinator, idx, value), result in zip(writes, results, strict=True):
+            item: dict[str, Any] = {
+                ATTR_FACILITY_ID: idx[0],
+                ATTR_COMPONENT_ID: idx[1],
+                ATTR_PARAMETER_ID: idx[2],
+                ATTR_VALUE: value,
+                "success": not isinstance(result, BaseException),
+            }
+            if isinstance(result, BaseException):
+                LOGGER.warning("Could not set %s to %s: %s", idx, value, result)
+                item["error"] = str(result)
+            response.append(item)
+        return {"results": response}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PARAMETERS,
+        async_set_parameters,
+        schema=SET_PARAMETERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _get_coordinator(
+    hass: HomeAssistant, entry_id: str | None, idx: tuple[int, str, str]
+) -> FroelingConnectDataUpdateCoordinator:
+    """Return the coordinator of the config entry that has the facility."""
+    entries: list[FroelingConnectConfigEntry] = (
+        hass.config_entries.async_loaded_entries(DOMAIN)
+    )
+    for entry in entries:
+        if entry_id in (None, entry.entry_id) and (
+            idx[0] in entry.runtime_data.components
+        ):
+            return entry.runtime_data
+    raise ServiceValidationError(f"No loaded config entry has facility {idx[0]}")
+
+
+def _validate(
+    coordinator: FroelingConnectDataUpdateCoordinator,
+    idx: tuple[int, str, str],
+    entry: dict[str, Any],
+) -> str:
+    """Return the raw value to send for an entry of set_parameters."""
+    slot = coordinator.store.get_slot(idx)
+    info = None if slot is None else coordinator.store.info[slot]
+    if info is None:
+        raise ServiceValidationError(f"Unknown parameter {'_'.join(map(str, idx))}")
+    if not info.editable or not coordinator.config_entry.data[CONF_SEND_CHANGES]:
+        raise ServiceValidationError(f"{_name(info)} can not be changed")
+
+    value = entry[ATTR_VALUE]
+    if info.enum_map is not None:
+        text = _format(value) if isinstance(value, float) else value
+        if text in info.enum_map.labels:
+            return text
+        if (raw := info.enum_map.values.get(text)) is not None:
+            return raw
+        raise ServiceValidationError(
+            f"{text} is not a valid state for {_name(info)}, "
+            f"expected one of {', '.join(info.enum_map.options)}"
+        )
+
+    minimum = _number(info.min_val)
+    maximum = _number(info.max_val)
+    if info.parameter_type != "NumValueObject" and minimum is None and maximum is None:
+        return _format(value) if isinstance(value, float) else value
+    if not isinstance(value, float):
+        raise ServiceValidationError(f"{_name(info)} needs a number, not {value}")
+    if (minimum is not None and value < minimum) or (
+        maximum is not None and value > maximum
+    ):
+        raise ServiceValidationError(
+            f"{_format(value)} is out of range for {_name(info)} "
+            f"({info.min_val} to {info.max_val})"
+        )
+    if not (value / NUMBER_STEP).is_integer():
+        raise ServiceValidationError(
+            f"{_format(value)} is not a valid value for {_name(info)}, "
+            f"it is set in steps of {NUMBER_STEP}"
+        )
+    # The same value the number entity would send
+    return format_number(value)
+
+
+def _number(bound: str | None) -> float | None:
+    try:
+        return None if bound is None else float(bound)
+    except ValueError:
+        return None
+
+
+def _format(value: float) -> str:
+    """Format a number the way the cloud expects it."""
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+def _name(info: ParameterInfo) -> str:
+    return info.display_name or info.name or info.idx[2]
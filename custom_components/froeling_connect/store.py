@@ -0,0 +1,134 @@
+"""Compact storage of the parameter values of the Froeling Connect coordinator."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, KeysView, Mapping
+from dataclasses import dataclass
+import sys
+
+from froeling import Parameter
+
+from .enums import EnumMap
+
+
+def _intern(value: str | None) -> str | None:
+    """Share equal strings, most units and ranges repeat across parameters."""
+    return None if value is None else sys.intern(value)
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterInfo:
+    """The parts of a parameter that do not change between polls."""
+
+    idx: tuple[int, str, str]  # (facility_id, component_id, parameter_id)
+    display_name: str | None
+    name: str | None
+    editable: bool | None
+    parameter_type: str | None
+    unit: str | None
+    min_val: str | None
+    max_val: str | None
+    enum_map: EnumMap | None
+
+    @classmethod
+    def from_parameter(
+        cls, idx: tuple[int, str, str], parameter: Parameter
+    ) -> ParameterInfo:
+        """Take the static parts of a parameter."""
+        return cls(
+            idx,
+            parameter.display_name,
+            parameter.name,
+            parameter.editable,
+            _intern(parameter.parameter_type),
+            _intern(parameter.unit),
+            _intern(parameter.min_val),
+            _intern(parameter.max_val),
+            EnumMap.from_parameter(parameter),
+        )
+
+
+class ParameterStore:
+    """The values of all parameters in one list, indexed by a slot number.
+
+    Each parameter gets a slot when it is first seen and keeps it for as
+    long as it exists. Polled values are copied into their slots in place.
+    Slots of removed parameters are cleared and not handed out again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.info: list[ParameterInfo | None] = []
+        self.values: list[str | None] = []
+        self._slots: dict[tuple[int, str, str], int] = {}
+        # Slots per (facility_id, component_id), keyed by parameter id
+        self._component_slots: dict[tuple[int, str], dict[str, int]] = {}
+        # Incremented whenever parameters are added or removed
+        self.layout_version = 0
+
+    def __contains__(self, idx: tuple[int, str, str]) -> bool:
+        """Return if the parameter exists."""
+        return idx in self._slots
+
+    def __len__(self) -> int:
+        """Return the number of parameters."""
+        return len(self._slots)
+
+    def keys(self) -> KeysView[tuple[int, str, str]]:
+        """Return the keys of all parameters."""
+        return self._slots.keys()
+
+    def slot(self, idx: tuple[int, str, str]) -> int:
+        """Return the slot of a parameter."""
+        return self._slots[idx]
+
+    def get_slot(self, idx: tuple[int, str, str]) -> int | None:
+        """Return the slot of a parameter, None if it does not exist."""
+        return self._slots.get(idx)
+
+    def component_slots(self, key: tuple[int, str]) -> Iterator[int]:
+        """Return the slots of the parameters of a component."""
+        return iter(self._component_slots.get(key, {}).values())
+
+    def infos(self) -> Iterator[ParameterInfo]:
+        """Return the metadata of all parameters."""
+        return (info for info in self.info if info is not None)
+
+    def update_component(
+        self, key: tuple[int, str], parameters: Mapping[str, Parameter]
+    ) -> set[int]:
+        """Copy the polled parameters of a component into their slots.
+
+        Returns the slots whose value changed, including new parameters.
+        """
+        slots = self._component_slots.setdefault(key, {})
+        values = self.values
+        changed: set[int] = set()
+        for parameter_id, parameter in parameters.items():
+            if (slot := slots.get(parameter_id)) is None:
+                slot = slots[parameter_id] = self._add(
+                    (key[0], key[1], parameter_id), parameter
+                )
+            elif values[slot] == parameter.value:
+                continue
+            values[slot] = parameter.value
+            changed.add(slot)
+
+        if len(slots) > len(parameters):
+            for parameter_id in slots.keys() - parameters.keys():
+                self._remove((key[0], key[1], parameter_id), slots.pop(parameter_id))
+        return changed
+
+    def _add(self, idx: tuple[int, str, str], parameter: Parameter) -> int:
+        slot = len(self.values)
+        self.info.append(ParameterInfo.from_parameter(idx, parameter))
+        self.values.append(None)
+        self._slots[idx] = slot
+        self.layout_version += 1
+        return slot
+
+    def _remove(self, idx: tuple[int, str, str], slot: int) -> None:
+        self.info[slot] = None
+        self.values[slot] = None
+        del self._slots[idx]
+        self.layout_version += 1
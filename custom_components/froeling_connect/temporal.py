@@ -0,0 +1,79 @@
+"""Parsing of date and time parameters of Froeling Connect."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from functools import lru_cache
+import re
+
+from homeassistant.util import dt as dt_util
+
+# Distinct raw values kept parsed, values rarely change between polls
+PARSE_CACHE_SIZE = 1024
+
+_FORMATS: tuple[tuple[str, type[date | time]], ...] = (
+    ("%d.%m.%Y %H:%M:%S", datetime),
+    ("%d.%m.%Y %H:%M", datetime),
+    ("%d.%m.%Y", date),
+    ("%H:%M:%S", time),
+    ("%H:%M", time),
+)
+
+# Units that spell out a format, like "dd.MM.yyyy HH:mm"
+_DATE_UNIT = re.compile(r"dd|yy", re.IGNORECASE)
+_TIME_UNIT = re.compile(r"hh|ss|:", re.IGNORECASE)
+
+
+def temporal_kind(
+    parameter_type: str | None, unit: str | None
+) -> type[date | time] | None:
+    """Return if a parameter holds a datetime, a date or a time of day.
+
+    Taken from the parameter type and, if it gives a format, the unit, so
+    it does not depend on the value. None if the parameter holds neither.
+    """
+    kind = (parameter_type or "").lower()
+    if "date" not in kind and "time" not in kind:
+        return None
+    has_date = "date" in kind or _DATE_UNIT.search(unit or "") is not None
+    has_time = "time" in kind or _TIME_UNIT.search(unit or "") is not None
+    if has_date and has_time:
+        return datetime
+    return date if has_date else time
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_temporal(raw: str | None) -> datetime | date | time | None:
+    """Parse the value of a date or time parameter, None if it is none.
+
+    Datetimes without a time zone are returned as they are, see as_local.
+    The results are cached per raw value.
+    """
+    if not raw:
+        return None
+    raw = raw.strip()
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except ValueError:
+        pass
+    else:
+        # A bare date is parsed to midnight
+        return parsed.date() if len(raw) == 10 else parsed
+    for fmt, kind in _FORMATS:
+        try:
+            parsed = datetime.strptime(raw, fmt)  # noqa: DTZ007
+        except ValueError:
+            continue
+        if kind is date:
+            return parsed.date()
+        if kind is time:
+            return parsed.time()
+        return parsed
+    return None
+
+
+def as_local(value: datetime) -> datetime:
+    """Return a datetime with the time zone of Home Assistant if it has none."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_util.get_default_time_zone())
+    return value
@@ -0,0 +1,138 @@
+"""Debounced queue for parameter writes of the Froeling Connect coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+from froeling import Parameter
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import LOGGER
+
+
+@dataclass
+class _PendingWrite:
+    """The latest value queued for a parameter and everyone waiting for it."""
+
+    parameter: Parameter
+    value: str
+    waiters: list[asyncio.Future[Any]] = field(default_factory=list)
+
+
+class ParameterWriteQueue:
+    """Collect parameter writes and send them in batches per component.
+
+    Writes to a component are held back until no further write to that
+    component was queued for ``debounce`` seconds. Of several writes to the
+    same parameter only the last value is sent, and every caller gets the
+    result of that request. Requests are made through ``request``, which
+    runs them within the request budget.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        request: Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]],
+        debounce: float,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self._request = request
+        self._debounce = debounce
+        # Pending writes per (facility_id, component_id), keyed by parameter id
+        self._pending: dict[tuple[int, str], dict[str, _PendingWrite]] = {}
+        self._timers: dict[tuple[int, str], CALLBACK_TYPE] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def async_write(
+        self, idx: tuple[int, str, str], parameter: Parameter, value: str
+    ) -> Any:
+        """Queue a write and wait for the result of the request that sends it."""
+        key = (idx[0], idx[1])
+        component_writes = self._pending.setdefault(key, {})
+        if (pending := component_writes.get(idx[2])) is None:
+            pending = component_writes[idx[2]] = _PendingWrite(parameter, value)
+        else:
+            LOGGER.debug(
+                "Replacing queued value %s of %s with %s",
+                pending.value,
+                parameter.name,
+                value,
+            )
+            pending.parameter = parameter
+            pending.value = value
+        waiter: asyncio.Future[Any] = self.hass.loop.create_future()
+        pending.waiters.append(waiter)
+
+        if (cancel := self._timers.pop(key, None)) is not None:
+            cancel()
+        self._timers[key] = async_call_later(
+            self.hass, self._debounce, partial(self._handle_debounce_done, key)
+        )
+        return await waiter
+
+    @callback
+    def _handle_debounce_done(self, key: tuple[int, str], _now: datetime) -> None:
+        """Send the writes of a component once no more are being queued."""
+        self._flush(key)
+
+    @callback
+    def _flush(self, key: tuple[int, str]) -> None:
+        """Start sending the queued writes of a component."""
+        self._timers.pop(key, None)
+        if not (writes := self._pending.pop(key, None)):
+            return
+        task = self.hass.async_create_background_task(
+            self._async_send(list(writes.values())),
+            f"froeling_connect write {key[0]}_{key[1]}",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_send(self, writes: list[_PendingWrite]) -> None:
+        """Send the writes of a component one after another.
+
+        If sending is cancelled, the callers of the writes that were not
+        sent get an error instead of waiting forever.
+        """
+        try:
+            for write in writes:
+                LOGGER.debug("Setting %s to %s", write.parameter.name, write.value)
+                try:
+                    result = await self._request(
+                        partial(write.parameter.set_value, write.value)
+                    )
+                except Exception as e:  # noqa: BLE001 - handed to the callers
+                    for waiter in write.waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for waiter in write.waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+        finally:
+            for write in writes:
+                for waiter in write.waiters:
+                    if not waiter.done():
+                        waiter.set_exception(
+                            HomeAssistantError(
+                                f"Setting {write.parameter.name} was cancelled"
+                            )
+                        )
+
+    async def async_shutdown(self) -> None:
+        """Send all queued writes now and wait until they are done."""
+        for cancel in self._timers.values():
+            cancel()
+        for key in list(self._pending):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
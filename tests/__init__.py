@@ -0,0 +1 @@
+"""Tests for the Fröling Connect integration."""
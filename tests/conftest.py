@@ -0,0 +1,236 @@
+"""Fixtures for the Fröling Connect tests."""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Generator
+import json
+import re
+import time
+from typing import Any
+from unittest.mock import patch
+
+from froeling.exceptions import NetworkError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.froeling_connect.const import (
+    CONF_REQUESTS_PER_SECOND,
+    CONF_SEND_CHANGES,
+    DOMAIN,
+)
+from homeassistant.const import CONF_LANGUAGE, CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+USER_ID = 1
+FACILITY_ID = 1
+BOILER = "1_c1"
+HEATING_CIRCUIT = "1_c2"
+
+
+def make_token(user_id: int = USER_ID, lifetime: int = 86400) -> str:
+    """Return an unsigned JWT like the ones the cloud hands out."""
+    payload = {"userId": user_id, "exp": int(time.time()) + lifetime}
+    encoded = base64.b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    return f"header.{encoded}.signature"
+
+
+def outage(url: str = "https://cloud") -> NetworkError:
+    """Return the error the library raises when the cloud is down."""
+    return NetworkError("Service unavailable", 503, url, "")
+
+
+def _parameter(
+    parameter_id: str, name: str, value: str, **fields: Any
+) -> dict[str, Any]:
+    return {
+        "id": parameter_id,
+        "displayName": name.capitalize(),
+        "name": name,
+        "editable": False,
+        "parameterType": "NumValueObject",
+        "unit": "",
+        "value": value,
+        "minVal": "0",
+        "maxVal": "100",
+    } | fields
+
+
+class FakeCloud:
+    """Answers the requests of the froeling library like the cloud does.
+
+    One facility with a boiler and a heating circuit. While ``down`` is
+    set, every request fails. Requests whose last path segment is in
+    ``failures``, like a component id or ``facility``, raise the given error. Written values are
+    kept unless ``keep_writes`` is False.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cloud."""
+        self.temperature = 40
+        self.last_service = "02.01.2024"
+        self.burner_start = ""
+        self.time_windows: dict[str, list[dict[str, Any]]] = {
+            BOILER: [
+                {
+                    "id": 1,
+                    "weekDay": "MONDAY",
+                    "phases": [
+                        {
+                            "startHour": 6,
+                            "startMinute": 0,
+                            "endHour": 8,
+                            "endMinute": 30,
+                        }
+                    ],
+                }
+            ]
+        }
+        self.down = False
+        self.failures: dict[str, BaseException] = {}
+        self.notifications: list[dict[str, Any]] = []
+        self.stored: dict[str, str] = {}
+        self.keep_writes = True
+        self.writes: list[tuple[str, str]] = []
+        self.requests: list[str] = []
+
+    def component(self, component_id: str) -> dict[str, Any]:
+        """Return the payload of a component."""
+        return {
+            "componentId": component_id,
+            "displayName": f"Component {component_id}",
+            "displayCategory": "category",
+            "standardName": "standard",
+            "type": "BOILER" if component_id == BOILER else "HK",
+            "subType": "sub",
+            "timeWindowsView": self.time_windows.get(component_id, []),
+            "topView": {
+                "pictureParams": {
+                    "temp": _parameter(
+                        f"{component_id}t",
+                        "boilerTemp",
+                        str(self.temperature),
+                        unit="°C",
+                    )
+                }
+            },
+            "stateView": [
+                _parameter(
+                    f"{component_id}d",
+                    "lastService",
+                    self.last_service,
+                    parameterType="DateValueObject",
+                ),
+                _parameter(
+                    f"{component_id}s",
+                    "burnerStart",
+                    self.burner_start,
+                    parameterType="TimeValueObject",
+                    unit="dd.MM.yyyy HH:mm",
+                ),
+            ],
+            "setupView": [
+                _parameter(
+                    f"{component_id}n",
+                    "setTemp",
+                    self.stored.get(f"{component_id}n", "55"),
+                    editable=True,
+                    unit="°C",
+                    minVal="30",
+                    maxVal="80",
+                )
+            ],
+        }
+
+    async def request(self, method: str, url: Any, **kwargs: Any) -> Any:
+        """Answer a request."""
+        url = str(url)
+        self.requests.append(url)
+        if self.down:
+            raise outage(url)
+        if (error := self.failures.get(url.rsplit("/", 1)[-1])) is not None:
+            raise error
+        if match := re.search(r"/facility/\d+/component/([^/]+)$", url):
+            return self.component(match[1])
+        if re.search(r"/facility/\d+/componentList$", url):
+            return [
+                {"componentId": BOILER, "displayName": "Boiler", "type": "BOILER"},
+                {"componentId": HEATING_CIRCUIT, "displayName": "HK 1", "type": "HK"},
+            ]
+        if url.endswith("/facility"):
+            return [
+                {
+                    "facilityId": FACILITY_ID,
+                    "equipmentNumber": 100,
+                    "name": "Facility",
+                    "facilityGeneration": "G",
+                }
+            ]
+        if "/parameter/" in url:
+            parameter_id = url.rsplit("/", 1)[-1]
+            value = kwargs["json"]["value"]
+            self.writes.append((parameter_id, value))
+            if self.keep_writes:
+                self.stored[parameter_id] = value
+            return {}
+        if "notification/count" in url:
+            return {
+                "unreadNotifications": sum(
+                    notification["unread"] for notification in self.notifications
+                )
+            }
+        if url.endswith("/notification"):
+            return self.notifications
+        raise NetworkError("Not found", 404, url, "")
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,
+) -> Generator[None]:
+    """Enable the integration in all tests."""
+    yield
+
+
+@pytest.fixture
+def cloud() -> Generator[FakeCloud]:
+    """Route the requests of the froeling library to a fake cloud."""
+    fake = FakeCloud()
+
+    async def request(_session: Any, method: str, url: Any, **kwargs: Any) -> Any:
+        return await fake.request(method, url, **kwargs)
+
+    with patch("froeling.session.Session.request", request):
+        yield fake
+
+
+@pytest.fixture
+def mock_config_entry() -> MockConfigEntry:
+    """Return a config entry of the integration."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Fröling",
+        unique_id=str(USER_ID),
+        data={
+            CONF_USERNAME: "user@example.com",
+            CONF_PASSWORD: "password",
+            CONF_TOKEN: make_token(),
+            CONF_LANGUAGE: "en",
+            CONF_SEND_CHANGES: True,
+            "user_id": USER_ID,
+        },
+        options={CONF_REQUESTS_PER_SECOND: 20},
+    )
+
+
+@pytest.fixture
+async def init_integration(
+    hass: HomeAssistant, cloud: FakeCloud, mock_config_entry: MockConfigEntry
+) -> MockConfigEntry:
+    """Set up the integration."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    return mock_config_entry
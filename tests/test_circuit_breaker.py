@@ -0,0 +1,147 @@
+"""Tests for the circuit breaker of the Fröling Connect integration."""
+
+from datetime import timedelta
+
+from aiohttp import ClientConnectionError
+from freezegun.api import FrozenDateTimeFactory
+from froeling.exceptions import NetworkError
+import pytest
+
+from custom_components.froeling_connect.circuit_breaker import (
+    BreakerState,
+    CircuitBreaker,
+    CloudUnavailableError,
+    is_outage,
+)
+from custom_components.froeling_connect.const import (
+    BREAKER_BASE_DELAY,
+    BREAKER_JITTER,
+    DOMAIN,
+)
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .conftest import FakeCloud
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_threshold=2,
+        base_delay=timedelta(seconds=30),
+        max_delay=timedelta(minutes=2),
+        jitter=0,
+    )
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (NetworkError("Service unavailable", 503, "url", ""), True),
+        (NetworkError("No connection", None, "url", ""), True),
+        (NetworkError("Not found", 404, "url", ""), False),
+        (TimeoutError(), True),
+        (ClientConnectionError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_outage(error: BaseException, expected: bool) -> None:
+    """Test which errors count as an outage."""
+    assert is_outage(error) is expected
+
+
+async def test_breaker_opens_and_backs_off(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the breaker opens after failures and doubles its delay."""
+    breaker = _breaker()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    await breaker.async_before_request()
+
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.time_until_retry(breaker.retry_at - timedelta(seconds=30)) == (
+        timedelta(seconds=30)
+    )
+    with pytest.raises(CloudUnavailableError):
+        await breaker.async_before_request()
+
+    freezer.tick(timedelta(seconds=31))
+    await breaker.async_before_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+
+    # The probe failed, the next delay is twice as long
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    freezer.tick(timedelta(seconds=59))
+    with pytest.raises(CloudUnavailableError):
+        await breaker.async_before_request()
+
+    freezer.tick(timedelta(seconds=2))
+    await breaker.async_before_request()
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.openings == 0
+    assert breaker.retry_at is None
+
+
+async def test_breaker_aborted_probe(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the next request probes again if the probe was cancelled."""
+    breaker = _breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    freezer.tick(timedelta(minutes=1))
+    await breaker.async_before_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+
+    breaker.record_aborted()
+    assert breaker.state is BreakerState.OPEN
+    await breaker.async_before_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_refresh_while_cloud_is_down(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test polls stop while the breaker is open and resume when it closes."""
+    coordinator = init_integration.runtime_data
+    breaker = coordinator.account.breaker
+    outage_sensor = er.async_get(hass).async_get_entity_id(
+        "binary_sensor", DOMAIN, f"{init_integration.entry_id}_cloud_outage"
+    )
+    assert outage_sensor is not None
+    assert hass.states.get(outage_sensor).state == STATE_OFF
+
+    cloud.down = True
+    freezer.tick(timedelta(hours=1))
+    await coordinator.async_refresh()
+    freezer.tick(timedelta(hours=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert breaker.state is BreakerState.OPEN
+    assert not coordinator.last_update_success
+    assert hass.states.get(outage_sensor).state == STATE_ON
+    # The next refresh waits for the breaker
+    assert coordinator.update_interval >= BREAKER_BASE_DELAY * (1 - BREAKER_JITTER)
+
+    # No request is made until the delay is over
+    requests = len(cloud.requests)
+    await coordinator.async_refresh()
+    assert len(cloud.requests) == requests
+
+    cloud.down = False
+    freezer.tick(timedelta(hours=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert breaker.state is BreakerState.CLOSED
+    assert coordinator.last_update_success
+    assert hass.states.get(outage_sensor).state == STATE_OFF
@@ -0,0 +1,46 @@
+"""Tests for the config flow of the Fröling Connect integration."""
+
+from custom_components.froeling_connect.const import (
+    CONF_FAST_INTERVAL,
+    CONF_SLOW_COMPONENTS,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from .conftest import BOILER, FACILITY_ID
+
+
+async def test_options_keep_detecting_slow_components(
+    hass: HomeAssistant, init_integration
+) -> None:
+    """Test saving the options without choosing slow components keeps detecting them."""
+    result = await hass.config_entries.options.async_init(init_integration.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert "slow_components" in result["description_placeholders"]
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_FAST_INTERVAL: 60}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert init_integration.options[CONF_FAST_INTERVAL] == 60
+    assert CONF_SLOW_COMPONENTS not in init_integration.options
+
+
+async def test_options_choose_slow_components(
+    hass: HomeAssistant, init_integration
+) -> None:
+    """Test chosen slow components are stored and shown as the default."""
+    slow = [f"{FACILITY_ID}_{BOILER}"]
+    result = await hass.config_entries.options.async_init(init_integration.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SLOW_COMPONENTS: slow}
+    )
+    await hass.async_block_till_done()
+    assert init_integration.options[CONF_SLOW_COMPONENTS] == slow
+
+    result = await hass.config_entries.options.async_init(init_integration.entry_id)
+    schema = result["data_schema"].schema
+    key = next(key for key in schema if key == CONF_SLOW_COMPONENTS)
+    assert key.default() == slow
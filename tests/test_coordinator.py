@@ -0,0 +1,216 @@
+"""Tests for the coordinator of the Fröling Connect integration."""
+
+import asyncio
+from datetime import timedelta
+
+from aiohttp import ClientConnectionError
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.froeling_connect.const import (
+    DOMAIN,
+    WRITE_CONFIRM_DELAY,
+    WRITE_DEBOUNCE,
+)
+from homeassistant.components.number import (
+    ATTR_VALUE,
+    DOMAIN as NUMBER_DOMAIN,
+    SERVICE_SET_VALUE,
+)
+from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+
+from .conftest import BOILER, FACILITY_ID, HEATING_CIRCUIT, FakeCloud, outage
+
+
+def _entity_id(
+    hass: HomeAssistant, platform: str, component_id: str, suffix: str
+) -> str:
+    entity_id = er.async_get(hass).async_get_entity_id(
+        platform, DOMAIN, f"{FACILITY_ID}_{component_id}_{component_id}{suffix}"
+    )
+    assert entity_id is not None
+    return entity_id
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_refresh_with_failed_component(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a failing component does not fail the others."""
+    coordinator = init_integration.runtime_data
+    boiler = _entity_id(hass, "sensor", BOILER, "t")
+    heating_circuit = _entity_id(hass, "sensor", HEATING_CIRCUIT, "t")
+    assert hass.states.get(boiler).state == "40"
+
+    cloud.temperature = 41
+    cloud.failures[HEATING_CIRCUIT] = outage()
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert hass.states.get(boiler).state == "41"
+    # The last value is kept until the data counts as stale
+    assert hass.states.get(heating_circuit).state == "40"
+    status = coordinator.data.components[(FACILITY_ID, HEATING_CIRCUIT)]
+    assert not status.stale
+    assert status.last_error is not None
+
+    freezer.tick(timedelta(hours=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert hass.states.get(boiler).state == "41"
+    assert hass.states.get(heating_circuit).state == STATE_UNAVAILABLE
+
+    cloud.failures[BOILER] = outage()
+    freezer.tick(timedelta(hours=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert not coordinator.last_update_success
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_refresh_with_dropped_connection(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a connection error of one component does not fail the others."""
+    coordinator = init_integration.runtime_data
+    cloud.temperature = 41
+    cloud.failures[HEATING_CIRCUIT] = ClientConnectionError()
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert hass.states.get(_entity_id(hass, "sensor", BOILER, "t")).state == "41"
+    assert hass.states.get(_entity_id(hass, "sensor", HEATING_CIRCUIT, "t")).state == (
+        "40"
+    )
+    status = coordinator.data.components[(FACILITY_ID, HEATING_CIRCUIT)]
+    assert status.last_error == repr(ClientConnectionError())
+
+
+async def _async_set_value(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, entity_id: str, value: float
+) -> None:
+    """Set a number and check it is shown as pending until it is confirmed."""
+    task = hass.async_create_task(
+        hass.services.async_call(
+            NUMBER_DOMAIN,
+            SERVICE_SET_VALUE,
+            {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: value},
+            blocking=True,
+        )
+    )
+    await asyncio.sleep(0)
+    state = hass.states.get(entity_id)
+    assert float(state.state) == value
+    assert state.attributes["pending"] is True
+
+    freezer.tick(timedelta(seconds=WRITE_DEBOUNCE))
+    async_fire_time_changed(hass)
+    await task
+    assert hass.states.get(entity_id).attributes["pending"] is True
+
+    freezer.tick(timedelta(seconds=WRITE_CONFIRM_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_write_confirmed(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a written value is kept once a poll confirms it."""
+    setpoint = _entity_id(hass, "number", BOILER, "n")
+
+    await _async_set_value(hass, freezer, setpoint, 70)
+
+    assert cloud.writes == [(f"{BOILER}n", "70")]
+    state = hass.states.get(setpoint)
+    assert state.state == "70"
+    assert "pending" not in state.attributes
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_write_rolled_back(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a written value is rolled back if the poll shows the old one."""
+    setpoint = _entity_id(hass, "number", BOILER, "n")
+    cloud.keep_writes = False
+
+    await _async_set_value(hass, freezer, setpoint, 70)
+
+    assert cloud.writes == [(f"{BOILER}n", "70")]
+    state = hass.states.get(setpoint)
+    assert state.state == "55"
+    assert "pending" not in state.attributes
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_write_without_connection(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a write that could not be sent fails and shows the old value."""
+    setpoint = _entity_id(hass, "number", BOILER, "n")
+    cloud.failures[f"{BOILER}n"] = ClientConnectionError()
+    task = hass.async_create_task(
+        hass.services.async_call(
+            NUMBER_DOMAIN,
+            SERVICE_SET_VALUE,
+            {ATTR_ENTITY_ID: setpoint, ATTR_VALUE: 70},
+            blocking=True,
+        )
+    )
+    await asyncio.sleep(0)
+
+    freezer.tick(timedelta(seconds=WRITE_DEBOUNCE))
+    async_fire_time_changed(hass)
+    with pytest.raises(HomeAssistantError, match="Could not set"):
+        await task
+
+    state = hass.states.get(setpoint)
+    assert state.state == "55"
+    assert "pending" not in state.attributes
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_cleared_schedule(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the schedule of a component is removed once its time windows are."""
+    coordinator = init_integration.runtime_data
+    assert (FACILITY_ID, BOILER) in coordinator.schedules
+
+    cloud.time_windows.clear()
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+
+    assert (FACILITY_ID, BOILER) not in coordinator.schedules
+    assert coordinator.data.changed_schedules == {(FACILITY_ID, BOILER)}
@@ -0,0 +1,126 @@
+"""Tests for the errors of the facilities of the Fröling Connect integration."""
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.froeling_connect.const import (
+    DOMAIN,
+    ERROR_POLL_INTERVAL,
+    EVENT_ERROR,
+)
+from homeassistant.const import CONF_LANGUAGE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+
+from .conftest import FACILITY_ID, FakeCloud
+
+NOTIFICATION = {
+    "id": 5,
+    "subject": "Fuel empty",
+    "unread": True,
+    "notificationDate": "2026-01-02T10:00:00",
+    "errorId": 42,
+    "notificationType": "ERROR",
+    "facilityId": FACILITY_ID,
+    "facilityName": "Facility",
+}
+
+
+def _notification_requests(cloud: FakeCloud) -> int:
+    return sum(url.endswith("/notification/count") for url in cloud.requests)
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_errors_reported(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test an error is reported once while it is unread."""
+    cloud.notifications = [
+        NOTIFICATION,
+        # The same occurrence notified again
+        NOTIFICATION | {"id": 6},
+        NOTIFICATION | {"id": 7, "notificationType": "INFO"},
+    ]
+    events = async_capture_events(hass, EVENT_ERROR)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [event.data["state"] for event in events] == ["new"]
+    assert events[0].data["error_id"] == 42
+    issues = [
+        issue for issue in ir.async_get(hass).issues.values() if issue.domain == DOMAIN
+    ]
+    assert len(issues) == 1
+    assert issues[0].severity is ir.IssueSeverity.ERROR
+
+    cloud.notifications = [NOTIFICATION | {"unread": False}]
+    freezer.tick(ERROR_POLL_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [event.data["state"] for event in events] == ["new", "cleared"]
+    assert not [
+        issue for issue in ir.async_get(hass).issues.values() if issue.domain == DOMAIN
+    ]
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_notifications_fetched_once_per_account(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test config entries of one account share the fetch of the notifications."""
+    cloud.notifications = [NOTIFICATION]
+    events = async_capture_events(hass, EVENT_ERROR)
+    mock_config_entry.add_to_hass(hass)
+    other_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=mock_config_entry.unique_id,
+        data=mock_config_entry.data,
+        options=mock_config_entry.options,
+    )
+    other_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert other_entry.runtime_data.account is mock_config_entry.runtime_data.account
+
+    assert _notification_requests(cloud) == 1
+    # Each entry reports the errors of its facilities
+    assert sorted(event.data["config_entry_id"] for event in events) == sorted(
+        [mock_config_entry.entry_id, other_entry.entry_id]
+    )
+
+    freezer.tick(ERROR_POLL_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert _notification_requests(cloud) == 2
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_notifications_in_each_language(
+    hass: HomeAssistant, cloud: FakeCloud, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the notifications are fetched in the language of each entry."""
+    mock_config_entry.add_to_hass(hass)
+    MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=mock_config_entry.unique_id,
+        data=mock_config_entry.data | {CONF_LANGUAGE: "de"},
+        options=mock_config_entry.options,
+    ).add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert _notification_requests(cloud) == 2
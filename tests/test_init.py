@@ -0,0 +1,84 @@
+"""Tests for the setup of the Fröling Connect integration."""
+
+from datetime import timedelta
+from typing import Any
+
+from aiohttp import ClientConnectionError
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.froeling_connect.const import DISCOVERY_RETRY_DELAY, DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from .conftest import BOILER, FACILITY_ID, HEATING_CIRCUIT, FakeCloud
+
+
+async def test_setup_and_unload(hass: HomeAssistant, init_integration) -> None:
+    """Test the components are discovered and the entry unloads."""
+    assert init_integration.state is ConfigEntryState.LOADED
+    coordinator = init_integration.runtime_data
+    assert set(coordinator.components[FACILITY_ID]) == {BOILER, HEATING_CIRCUIT}
+    # Entity ids are made of the facility, the component and the parameter
+    assert hass.states.get("sensor.1_component_1_c1_boilertemp")
+
+    assert await hass.config_entries.async_unload(init_integration.entry_id)
+    await hass.async_block_till_done()
+    assert init_integration.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_setup_retried_when_cloud_unreachable(
+    hass: HomeAssistant, cloud: FakeCloud, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the setup is retried if no connection could be made."""
+    cloud.failures["facility"] = ClientConnectionError()
+    mock_config_entry.add_to_hass(hass)
+
+    assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_setup_with_unreachable_notifications(
+    hass: HomeAssistant, cloud: FakeCloud, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test failing to fetch the errors does not fail the setup."""
+    cloud.failures["count"] = ClientConnectionError()
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_cached_setup_retries_discovery(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    cloud: FakeCloud,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a setup from the cache checks the facilities again if that failed."""
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.{init_integration.entry_id}" in hass_storage
+    assert await hass.config_entries.async_unload(init_integration.entry_id)
+
+    cloud.failures["facility"] = ClientConnectionError()
+    assert await hass.config_entries.async_setup(init_integration.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert init_integration.state is ConfigEntryState.LOADED
+    assert hass.states.async_all("sensor")
+
+    del cloud.failures["facility"]
+    cloud.requests.clear()
+    freezer.tick(DISCOVERY_RETRY_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert any(url.endswith("/facility") for url in cloud.requests)
@@ -0,0 +1,57 @@
+"""Tests for the sensors of the Fröling Connect integration."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from custom_components.froeling_connect.const import DOMAIN
+from homeassistant.components.sensor import ATTR_STATE_CLASS, SensorDeviceClass
+from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .conftest import BOILER, FACILITY_ID, FakeCloud
+
+
+def _entity_id(hass: HomeAssistant, suffix: str) -> str:
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{FACILITY_ID}_{BOILER}_{BOILER}{suffix}"
+    )
+    assert entity_id is not None
+    return entity_id
+
+
+async def test_measurement(hass: HomeAssistant, init_integration) -> None:
+    """Test a number with a unit becomes a measurement."""
+    state = hass.states.get(_entity_id(hass, "t"))
+    assert state.state == "40"
+    assert state.attributes[ATTR_DEVICE_CLASS] == SensorDeviceClass.TEMPERATURE
+    assert state.attributes[ATTR_STATE_CLASS] == "measurement"
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_temporal_device_class(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the device class of dates and times follows the type and unit."""
+    last_service = _entity_id(hass, "d")
+    burner_start = _entity_id(hass, "s")
+
+    state = hass.states.get(last_service)
+    assert state.state == "2024-01-02"
+    assert state.attributes[ATTR_DEVICE_CLASS] == SensorDeviceClass.DATE
+    # Known to be a timestamp before it has a value
+    state = hass.states.get(burner_start)
+    assert state.state == STATE_UNKNOWN
+    assert state.attributes[ATTR_DEVICE_CLASS] == SensorDeviceClass.TIMESTAMP
+
+    cloud.burner_start = "03.01.2024 06:30"
+    freezer.tick(timedelta(minutes=1))
+    await init_integration.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(burner_start).state.startswith("2024-01-03T")
@@ -0,0 +1,96 @@
+"""Tests for the services of the Fröling Connect integration."""
+
+import asyncio
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.froeling_connect.const import (
+    ATTR_COMPONENT_ID,
+    ATTR_FACILITY_ID,
+    ATTR_PARAMETER_ID,
+    ATTR_PARAMETERS,
+    ATTR_VALUE,
+    DOMAIN,
+    SERVICE_SET_PARAMETERS,
+    WRITE_DEBOUNCE,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from .conftest import BOILER, FACILITY_ID, HEATING_CIRCUIT, FakeCloud
+
+
+def _setpoint(component_id: str, value: float | str) -> dict[str, str | int | float]:
+    return {
+        ATTR_FACILITY_ID: FACILITY_ID,
+        ATTR_COMPONENT_ID: component_id,
+        ATTR_PARAMETER_ID: f"{component_id}n",
+        ATTR_VALUE: value,
+    }
+
+
+@pytest.mark.freeze_time(tick=True)
+async def test_set_parameters(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test numbers are sent the way the number entities send them."""
+    task = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_PARAMETERS,
+            {
+                ATTR_PARAMETERS: [
+                    _setpoint(BOILER, 60.0),
+                    _setpoint(HEATING_CIRCUIT, "45"),
+                ]
+            },
+            blocking=True,
+            return_response=True,
+        )
+    )
+    await asyncio.sleep(0)
+    freezer.tick(timedelta(seconds=WRITE_DEBOUNCE))
+    async_fire_time_changed(hass)
+    response = await task
+
+    assert [result["success"] for result in response["results"]] == [True, True]
+    assert sorted(cloud.writes) == [(f"{BOILER}n", "60"), (f"{HEATING_CIRCUIT}n", "45")]
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        (60.5, "steps of 1"),
+        (90, "out of range"),
+        ("warm", "needs a number"),
+    ],
+)
+async def test_set_parameters_invalid(
+    hass: HomeAssistant,
+    cloud: FakeCloud,
+    init_integration,
+    value: float | str,
+    message: str,
+) -> None:
+    """Test nothing is written if a value is invalid."""
+    with pytest.raises(ServiceValidationError, match=message):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_PARAMETERS,
+            {
+                ATTR_PARAMETERS: [
+                    _setpoint(HEATING_CIRCUIT, 50),
+                    _setpoint(BOILER, value),
+                ]
+            },
+            blocking=True,
+            return_response=True,
+        )
+
+    assert cloud.writes == []
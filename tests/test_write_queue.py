@@ -0,0 +1,93 @@
+"""Tests for the write queue of the Fröling Connect integration."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.froeling_connect.write_queue import ParameterWriteQueue
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+
+def _parameter(name: str) -> MagicMock:
+    parameter = MagicMock()
+    parameter.name = name
+    parameter.set_value = AsyncMock(return_value={})
+    return parameter
+
+
+async def _request(request: Callable[[], Awaitable[Any]]) -> Any:
+    return await request()
+
+
+async def test_writes_are_batched(hass: HomeAssistant) -> None:
+    """Test only the last value of a parameter is sent and everyone gets it."""
+    queue = ParameterWriteQueue(hass, _request, 0.01)
+    setpoint = _parameter("setTemp")
+    mode = _parameter("mode")
+
+    results = await asyncio.gather(
+        queue.async_write((1, "c", "n"), setpoint, "50"),
+        queue.async_write((1, "c", "n"), setpoint, "60"),
+        queue.async_write((1, "c", "m"), mode, "1"),
+    )
+
+    assert results == [{}, {}, {}]
+    setpoint.set_value.assert_awaited_once_with("60")
+    mode.set_value.assert_awaited_once_with("1")
+
+
+async def test_failed_write(hass: HomeAssistant) -> None:
+    """Test a failed write is raised to its callers only."""
+    queue = ParameterWriteQueue(hass, _request, 0.01)
+    setpoint = _parameter("setTemp")
+    setpoint.set_value.side_effect = TimeoutError
+    mode = _parameter("mode")
+
+    results = await asyncio.gather(
+        queue.async_write((1, "c", "n"), setpoint, "50"),
+        queue.async_write((1, "c", "m"), mode, "1"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], TimeoutError)
+    assert results[1] == {}
+
+
+async def test_cancelled_send(hass: HomeAssistant) -> None:
+    """Test the callers get an error when sending their writes is cancelled."""
+    started = asyncio.Event()
+
+    async def request(_request: Callable[[], Awaitable[Any]]) -> Any:
+        started.set()
+        await asyncio.Event().wait()
+
+    queue = ParameterWriteQueue(hass, request, 0.01)
+    writes = [
+        hass.async_create_task(queue.async_write((1, "c", "n"), _parameter("a"), "1")),
+        hass.async_create_task(queue.async_write((1, "c", "m"), _parameter("b"), "2")),
+    ]
+    await asyncio.wait_for(started.wait(), 1)
+
+    for task in list(queue._tasks):
+        task.cancel()
+
+    for write in writes:
+        with pytest.raises(HomeAssistantError, match="was cancelled"):
+            await asyncio.wait_for(write, 1)
+
+
+async def test_shutdown_sends_queued_writes(hass: HomeAssistant) -> None:
+    """Test writes still waiting for the debounce are sent on shutdown."""
+    queue = ParameterWriteQueue(hass, _request, 60)
+    setpoint = _parameter("setTemp")
+    write = hass.async_create_task(queue.async_write((1, "c", "n"), setpoint, "50"))
+    await asyncio.sleep(0)
+
+    await queue.async_shutdown()
+
+    assert await write == {}
+    setpoint.set_value.assert_awaited_once_with("50")